@@ -92,6 +92,30 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The feed cache is invalidated by fetch_news / summarize_news, which run in their own
+# processes, so the default backend must be shared between processes (file based).
+# In production point this at Redis: CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+
+# Rendered feed pages live in their own alias, so culling them never evicts the
+# small long-lived keys in 'default' (feed:last_modified, the seen-URL Bloom filter).
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv("CACHE_BACKEND", "django.core.cache.backends.filebased.FileBasedCache"),
+        'LOCATION': os.getenv("CACHE_LOCATION", str(BASE_DIR / '.cache')),
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv("CACHE_MAX_ENTRIES", "1000"))},
+    },
+    'feed': {
+        'BACKEND': os.getenv("CACHE_BACKEND", "django.core.cache.backends.filebased.FileBasedCache"),
+        'LOCATION': os.getenv("FEED_CACHE_LOCATION", str(BASE_DIR / '.cache' / 'feed')),
+        'KEY_PREFIX': 'feed',
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv("FEED_CACHE_MAX_ENTRIES", "1000"))},
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
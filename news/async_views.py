@@ -0,0 +1,226 @@
+"""
+Async (ASGI) versions of the AI endpoints.
+
+Served by backend.asgi under uvicorn/daphne, each request awaits Gemini and
+Qdrant instead of holding a worker thread for the whole LLM round trip.
+They also work under runserver/WSGI, where asgiref gives every request its
+own event loop; the async Gemini and Qdrant clients are kept per loop.
+"""
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from news.models import SummaryPage
+from news.services.comparisons import aget_career_comparison
+from news.services.gemini import (
+    aarticle_conversation,
+    ageneral_conversation,
+    astream_article_conversation,
+    astream_general_conversation,
+)
+from news.views import sse_event
+
+
+async def authenticate(request):
+    """Same JWT check the DRF views use; returns the user or None"""
+    try:
+        result = await sync_to_async(JWTAuthentication().authenticate)(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def read_json(request):
+    try:
+        data = json.loads(request.body or b"{}")
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+async def asse_response(chunks, done=None):
+    """
+    Server-sent events over an async generator, so ASGI servers flush each
+    chunk as it arrives (a sync iterator would be buffered whole).
+    The first chunk is awaited before the response starts, like sse_response,
+    so fallback and auth errors still become a JSON 500.
+    """
+    first = await anext(chunks, None)
+
+    async def events():
+        try:
+            if first:
+                yield sse_event({"delta": first})
+            async for text in chunks:
+                yield sse_event({"delta": text})
+        except Exception as e:
+            yield sse_event({"error": f"AI service failed: {str(e)}"}, event="error")
+            return
+        yield sse_event(done or {}, event="done")
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def unauthorized():
+    return JsonResponse(
+        {"detail": "Authentication credentials were not provided."},
+        status=401,
+    )
+
+
+def bad_json():
+    return JsonResponse({"error": "Request body must be a JSON object"}, status=400)
+
+
+# Token-authenticated JSON APIs, like the DRF views (which are csrf exempt too)
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncArticleChatView(View):
+
+    async def post(self, request):
+        if await authenticate(request) is None:
+            return unauthorized()
+
+        data = read_json(request)
+        if data is None:
+            return bad_json()
+
+        article_id = data.get("article_id")
+        summary_id = data.get("summary_id")
+        user_question = data.get("question")
+
+        if not article_id or not summary_id or not user_question:
+            return JsonResponse(
+                {"error": "article_id, summary_id and question are required"},
+                status=400
+            )
+
+        try:
+            summary = await SummaryPage.objects.select_related("article").aget(id=summary_id)
+        except SummaryPage.DoesNotExist:
+            return JsonResponse({"error": "Summary not found"}, status=404)
+
+        try:
+            article_text = summary.article.snippet or summary.article.title
+            reply = await aarticle_conversation(
+                article_text=article_text,
+                user_question=user_question
+            )
+            return JsonResponse({"reply": reply})
+        except Exception as e:
+            return JsonResponse({"error": f"AI service failed: {str(e)}"}, status=500)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncGeneralChatView(View):
+
+    async def post(self, request):
+        if await authenticate(request) is None:
+            return unauthorized()
+
+        data = read_json(request)
+        if data is None:
+            return bad_json()
+
+        user_question = data.get("question")
+        if not user_question:
+            return JsonResponse({"error": "Question is required"}, status=400)
+
+        try:
+            reply, used_context = await ageneral_conversation(user_question=user_question)
+            return JsonResponse({"reply": reply, "used_context": used_context})
+        except Exception as e:
+            return JsonResponse({"error": f"AI service failed: {str(e)}"}, status=500)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncArticleChatStreamView(View):
+
+    async def post(self, request):
+        if await authenticate(request) is None:
+            return unauthorized()
+
+        data = read_json(request)
+        if data is None:
+            return bad_json()
+
+        summary_id = data.get("summary_id")
+        user_question = data.get("question")
+
+        if not summary_id or not user_question:
+            return JsonResponse(
+                {"error": "summary_id and question are required"},
+                status=400
+            )
+
+        try:
+            summary = await SummaryPage.objects.select_related("article").aget(id=summary_id)
+        except SummaryPage.DoesNotExist:
+            return JsonResponse({"error": "Summary not found"}, status=404)
+
+        try:
+            article_text = summary.article.snippet or summary.article.title
+            chunks = astream_article_conversation(
+                article_text=article_text,
+                user_question=user_question
+            )
+            return await asse_response(chunks)
+        except Exception as e:
+            return JsonResponse({"error": f"AI service failed: {str(e)}"}, status=500)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncGeneralChatStreamView(View):
+
+    async def post(self, request):
+        if await authenticate(request) is None:
+            return unauthorized()
+
+        data = read_json(request)
+        if data is None:
+            return bad_json()
+
+        user_question = data.get("question")
+        if not user_question:
+            return JsonResponse({"error": "Question is required"}, status=400)
+
+        try:
+            chunks, used_context = await astream_general_conversation(user_question=user_question)
+            return await asse_response(chunks, done={"used_context": used_context})
+        except Exception as e:
+            return JsonResponse({"error": f"AI service failed: {str(e)}"}, status=500)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncCareerComparisonView(View):
+
+    async def post(self, request):
+        data = read_json(request)
+        if data is None:
+            return bad_json()
+
+        career1 = data.get("career1")
+        career2 = data.get("career2")
+
+        if not career1 or not career2:
+            return JsonResponse(
+                {"error": "Both career1 and career2 are required"},
+                status=400
+            )
+
+        try:
+            return JsonResponse(await aget_career_comparison(career1, career2))
+        except Exception as e:
+            return JsonResponse(
+                {"error": f"Failed to generate comparison: {str(e)}"},
+                status=500
+            )
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import time
+
+from django.core.cache import cache, caches
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.renderers import JSONRenderer
+
+# Upper bound on staleness if an invalidation is ever missed
+FEED_CACHE_TTL = int(os.getenv("FEED_CACHE_TTL_SECONDS", "300"))
+
+LAST_MODIFIED_KEY = "feed:last_modified"
+# Only these query parameters change a page; anything else must not add cache entries
+PAGE_PARAMS = ("cursor", "page_size")
+
+
+def invalidate_feed():
+    """
+    Called whenever an Article or SummaryPage changes. Bumping the timestamp
+    changes every page's cache key, so old entries are simply never read again.
+    """
+    # Whole seconds (HTTP date resolution), strictly increasing so
+    # If-Modified-Since never matches a newer version
+    previous = cache.get(LAST_MODIFIED_KEY) or 0
+    cache.set(LAST_MODIFIED_KEY, max(int(time.time()), previous + 1), None)
+
+
+def feed_last_modified():
+    last_modified = cache.get(LAST_MODIFIED_KEY)
+    if last_modified is None:
+        last_modified = int(time.time())
+        # add() so concurrent first requests agree on one value
+        cache.add(LAST_MODIFIED_KEY, last_modified, None)
+        last_modified = cache.get(LAST_MODIFIED_KEY, last_modified)
+    return last_modified
+
+
+def _not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        return etag in [t.strip() for t in if_none_match.split(",")] or if_none_match.strip() == "*"
+
+    if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    return if_modified_since is not None and last_modified <= if_modified_since
+
+
+def cached_feed_response(request, build):
+    """
+    Serve a pre-serialized feed page from the cache, rendering it with
+    build() -> data only on a miss. Supports ETag / Last-Modified revalidation.
+    """
+    last_modified = feed_last_modified()
+    params = ":".join(request.GET.get(p, "") for p in PAGE_PARAMS)
+    key = f"feed:page:{last_modified}:{request.path}:{params}"
+
+    # Pages go to their own alias (see CACHES), last_modified stays in 'default'
+    pages = caches["feed"]
+    entry = pages.get(key)
+    if entry is None:
+        body = JSONRenderer().render(build())
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        entry = (etag, body)
+        pages.set(key, entry, FEED_CACHE_TTL)
+
+    etag, body = entry
+    if _not_modified(request, etag, last_modified):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # Clients may keep the page but must revalidate (cheap 304) before reuse
+    response["Cache-Control"] = "no-cache"
+    return response
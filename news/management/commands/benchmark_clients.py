@@ -0,0 +1,59 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+from google import genai
+
+from news.services.gemini import get_client
+from news.services.qdrant_service import QdrantService, get_qdrant_service
+
+
+class Command(BaseCommand):
+    help = "Measure per-request client setup cost: new Qdrant and Gemini clients per request vs the shared ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument(
+            "--with-call",
+            action="store_true",
+            help="Also issue get_collections() each time (needs a running Qdrant)",
+        )
+
+    def time_per_call(self, fn, iterations):
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter() - t0) / iterations * 1000
+
+    def handle(self, *args, **options):
+        n = options["iterations"]
+        with_call = options["with_call"]
+
+        def fresh():
+            # What general_conversation / QdrantStatusAPIView used to do per request
+            gemini = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+            qdrant = QdrantService()
+            if with_call:
+                qdrant.client.get_collections()
+            qdrant.client.close()
+            gemini.close()
+
+        def shared():
+            get_client()
+            qdrant = get_qdrant_service()
+            if with_call:
+                qdrant.client.get_collections()
+
+        get_client()
+        get_qdrant_service()  # warm up: first use pays the setup once
+
+        fresh_ms = self.time_per_call(fresh, n)
+        shared_ms = self.time_per_call(shared, n)
+
+        label = "setup + get_collections" if with_call else "setup only"
+        self.stdout.write(f"{label}, {n} iterations:")
+        self.stdout.write(f"  new clients per request: {fresh_ms:.2f} ms/request")
+        self.stdout.write(f"  shared clients:          {shared_ms:.3f} ms/request")
+        self.stdout.write(self.style.SUCCESS(
+            f"Overhead removed: {fresh_ms - shared_ms:.2f} ms/request"
+        ))
@@ -0,0 +1,109 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from news.models import Article, SummaryPage
+from news.pagination import PublishedAtCursorPagination
+from news.views import feed_queryset
+from news.management.commands.summarize_news import CHUNK_SIZE
+
+# Synthetic rows are tagged by URL so --cleanup never touches real articles
+SYNTHETIC_URL_PREFIX = "https://synthetic.invalid/bench/"
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic articles and report feed / pending-summary query latency with EXPLAIN"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000, help="Synthetic articles to seed")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query")
+        parser.add_argument("--no-seed", action="store_true", help="Benchmark the existing rows only")
+        parser.add_argument("--cleanup", action="store_true", help="Delete synthetic rows afterwards")
+
+    def handle(self, *args, **options):
+        if not options["no_seed"]:
+            self.seed(options["rows"], options["batch_size"])
+
+        total = SummaryPage.objects.count()
+        self.stdout.write(f"Benchmarking with {total} summary pages.")
+
+        paginator = PublishedAtCursorPagination()
+        page_size = paginator.page_size
+        first_page = feed_queryset().order_by(*paginator.ordering)
+
+        # A cursor from deep inside the feed, to show the page cost doesn't grow with depth
+        deep_row = first_page[min(total - 1, total // 2):][:1]
+        deep_row = deep_row[0] if deep_row else None
+
+        queries = [("feed first page", first_page[:page_size + 1])]
+        if deep_row is not None and deep_row.article.published_at is not None:
+            queries.append((
+                "feed deep cursor",
+                first_page.filter(article__published_at__lte=deep_row.article.published_at)
+                .exclude(
+                    article__published_at=deep_row.article.published_at,
+                    article__id__gte=deep_row.article_id,
+                )[:page_size + 1],
+            ))
+        queries.append((
+            "pending summaries",
+            SummaryPage.objects.filter(summarized_at__isnull=True)
+            .order_by("id").values_list("id", flat=True)[:CHUNK_SIZE],
+        ))
+
+        for label, qs in queries:
+            timings = []
+            for _ in range(options["repeat"]):
+                t0 = time.perf_counter()
+                list(qs.all())
+                timings.append((time.perf_counter() - t0) * 1000)
+            timings.sort()
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{label}"))
+            self.stdout.write(
+                f"  median {timings[len(timings) // 2]:.2f} ms, "
+                f"max {timings[-1]:.2f} ms over {len(timings)} runs"
+            )
+            self.stdout.write("  EXPLAIN:")
+            for line in qs.explain().splitlines():
+                self.stdout.write(f"    {line}")
+
+        if options["cleanup"]:
+            deleted, _ = Article.objects.filter(url__startswith=SYNTHETIC_URL_PREFIX).delete()
+            self.stdout.write(f"\nRemoved {deleted} synthetic rows.")
+
+    def seed(self, rows, batch_size):
+        start = Article.objects.filter(url__startswith=SYNTHETIC_URL_PREFIX).count()
+        now = timezone.now()
+        self.stdout.write(f"Seeding {rows} synthetic articles...")
+
+        t0 = time.perf_counter()
+        for offset in range(start, start + rows, batch_size):
+            n = min(batch_size, start + rows - offset)
+            with transaction.atomic():
+                articles = Article.objects.bulk_create([
+                    Article(
+                        source="synthetic",
+                        title=f"Synthetic article {offset + i}",
+                        url=f"{SYNTHETIC_URL_PREFIX}{offset + i}",
+                        # ~2% undated, like some GDELT records
+                        published_at=None if random.random() < 0.02
+                        else now - timedelta(minutes=random.randint(0, 525600)),
+                        snippet="synthetic " * 50,
+                    )
+                    for i in range(n)
+                ])
+                SummaryPage.objects.bulk_create([
+                    SummaryPage(
+                        article=a,
+                        short_preview=a.title,
+                        # ~1% still waiting for the summarizer
+                        summarized_at=None if random.random() < 0.01 else now,
+                    )
+                    for a in articles
+                ])
+        self.stdout.write(f"Seeded in {time.perf_counter() - t0:.1f}s.")
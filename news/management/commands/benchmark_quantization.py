@@ -0,0 +1,133 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from qdrant_client.http import models
+
+from news.services.qdrant_service import QdrantService, UPSERT_BATCH_SIZE, search_params
+
+BYTES_PER_DIM = {"none": 4, "scalar": 1, "binary": 1 / 8}
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy up to --max-points of job_market_news into temporary float32 and "
+        "quantized collections and compare recall@k and query latency against "
+        "exact search over the same points"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kind", choices=["scalar", "binary", "all"], default="all")
+        parser.add_argument("--queries", type=int, default=50, help="Stored vectors reused as queries")
+        parser.add_argument("--limit", type=int, default=10, help="k for recall@k")
+        parser.add_argument("--max-points", type=int, default=20000, help="Points copied per collection")
+        parser.add_argument("--keep", action="store_true", help="Keep the benchmark collections")
+
+    def handle(self, *args, **options):
+        qdrant = QdrantService()
+
+        points = self.load_points(qdrant, options["max_points"])
+        if len(points) < 2:
+            raise CommandError(f"{qdrant.collection_name} needs indexed articles to benchmark.")
+
+        limit = options["limit"]
+        queries = random.sample(points, min(options["queries"], len(points)))
+        self.stdout.write(f"{len(points)} points, {len(queries)} queries, recall@{limit}")
+
+        # Baseline and ground truth come from an unquantized copy of the same
+        # points, so every row is measured on the same corpus
+        baseline = f"{qdrant.collection_name}_bench_float32"
+        self.copy_collection(qdrant, baseline, "none", points)
+        created = [baseline]
+        try:
+            # Exact (brute force) search on the float32 vectors is the ground truth
+            truth = {}
+            for p in queries:
+                hits = self.query(qdrant, baseline, p.vector, limit, models.SearchParams(exact=True))
+                truth[p.id] = {h.id for h in hits}
+
+            self.report(qdrant, "float32 (HNSW)", baseline, queries, truth, limit,
+                        search_params("none"), "none", len(points))
+
+            kinds = ["scalar", "binary"] if options["kind"] == "all" else [options["kind"]]
+            for kind in kinds:
+                name = f"{qdrant.collection_name}_bench_{kind}"
+                self.copy_collection(qdrant, name, kind, points)
+                created.append(name)
+                for rescore in (False, True):
+                    label = f"{kind}{' + rescore' if rescore else ''}"
+                    self.report(qdrant, label, name, queries, truth, limit,
+                                search_params(kind, rescore=rescore), kind, len(points))
+        finally:
+            if not options["keep"]:
+                for name in created:
+                    qdrant.client.delete_collection(collection_name=name)
+
+    def load_points(self, qdrant, max_points):
+        points = []
+        offset = None
+        while len(points) < max_points:
+            batch, offset = qdrant.client.scroll(
+                collection_name=qdrant.collection_name,
+                limit=min(UPSERT_BATCH_SIZE, max_points - len(points)),
+                offset=offset,
+                with_vectors=True,
+                with_payload=False,
+            )
+            points.extend(batch)
+            if offset is None:
+                break
+        return points
+
+    def copy_collection(self, qdrant, name, kind, points):
+        if qdrant.client.collection_exists(collection_name=name):
+            qdrant.client.delete_collection(collection_name=name)
+        qdrant.create_collection(name, quantization=kind)
+
+        for i in range(0, len(points), UPSERT_BATCH_SIZE):
+            qdrant.client.upsert(
+                collection_name=name,
+                points=[
+                    models.PointStruct(id=p.id, vector=p.vector)
+                    for p in points[i:i + UPSERT_BATCH_SIZE]
+                ],
+                wait=True,
+            )
+
+        # Wait for the optimizer so we measure the quantized index, not raw segments
+        deadline = time.monotonic() + 300
+        while time.monotonic() < deadline:
+            info = qdrant.client.get_collection(collection_name=name)
+            if info.status == models.CollectionStatus.GREEN:
+                break
+            time.sleep(1)
+
+    def query(self, qdrant, collection_name, vector, limit, params):
+        return qdrant.client.query_points(
+            collection_name=collection_name,
+            query=vector,
+            limit=limit + 1,  # the query vector itself is always a hit
+            with_payload=False,
+            search_params=params,
+        ).points
+
+    def report(self, qdrant, label, collection_name, queries, truth, limit, params, kind, count):
+        latencies = []
+        recalls = []
+        for p in queries:
+            t0 = time.perf_counter()
+            hits = self.query(qdrant, collection_name, p.vector, limit, params)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            expected = truth[p.id] - {p.id}
+            found = {h.id for h in hits} - {p.id}
+            if expected:
+                recalls.append(len(expected & found) / len(expected))
+
+        ram_mb = count * qdrant.vector_size * BYTES_PER_DIM[kind] / 1024 / 1024
+        p95 = sorted(latencies)[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+        self.stdout.write(
+            f"  {label:<20} recall@{limit} {statistics.mean(recalls) if recalls else 0:.3f}  "
+            f"p50 {statistics.median(latencies):.2f} ms  p95 {p95:.2f} ms  "
+            f"in-RAM vectors ~{ram_mb:.1f} MB"
+        )
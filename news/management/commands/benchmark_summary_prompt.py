@@ -0,0 +1,74 @@
+from django.core.management.base import BaseCommand
+
+from news.models import Article
+from news.management.commands.summarize_news import (
+    MODEL_NAME,
+    request_summary,
+    word_count,
+)
+
+# Not one of the sampled articles, so the warm-up cannot pre-cache a measured prompt
+WARM_UP_TEXT = "Warm-up request for the summary prompt benchmark."
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare Ollama prompt-eval cost with the summary instructions inlined "
+        "in every prompt versus sent once through the cached system prompt"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=5,
+            help="Number of articles to send in each mode",
+        )
+        parser.add_argument(
+            "--num-predict",
+            type=int,
+            default=1,
+            help="Tokens to generate per request (keep small, we only measure the prompt)",
+        )
+
+    def handle(self, *args, **options):
+        texts = []
+        for article in Article.objects.exclude(snippet="").order_by("-id").iterator():
+            text = article.snippet.strip()
+            if word_count(text) >= 300:
+                texts.append(text)
+            if len(texts) >= options["samples"]:
+                break
+
+        if not texts:
+            self.stdout.write(self.style.WARNING("No articles with 300+ words to benchmark."))
+            return
+
+        self.stdout.write(f"Benchmarking {MODEL_NAME} with {len(texts)} articles...")
+        self.stdout.write(
+            "Note: 'inline prompt' is today's request without the system prompt, still with "
+            "keep_alive and the template before the article; it is not the original baseline."
+        )
+        predict = {"num_predict": options["num_predict"]}
+
+        for label, cache_prefix in (("inline prompt", False), ("cached prefix", True)):
+            # Uncounted warm-up in this mode: loads the model and primes the slot with
+            # this mode's prefix, so neither mode gains from running second
+            request_summary(WARM_UP_TEXT, cache_prefix=cache_prefix, options=predict)
+
+            tokens = 0
+            eval_ns = 0
+            for text in texts:
+                result = request_summary(text, cache_prefix=cache_prefix, options=predict)
+                tokens += result.get("prompt_eval_count") or 0
+                eval_ns += result.get("prompt_eval_duration") or 0
+
+            n = len(texts)
+            self.stdout.write(
+                f"{label:>14}: {tokens / n:.0f} prompt tokens evaluated/article, "
+                f"{eval_ns / n / 1e6:.0f} ms prompt eval/article"
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            "Done. Both modes were measured after a warm-up request of their own."
+        ))
@@ -1,21 +1,34 @@
+import math
 import os
+import re
 
 import requests
 from bs4 import BeautifulSoup
 
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from django.db import connection, transaction
 from django.utils import timezone
 from dateutil import parser
+from datetime import timedelta
 
 
 from django.utils.text import slugify
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from news.models import Article, SummaryPage, Topic
+from news.models import Article, ArticleSignature, SeenUrl, SummaryPage, Topic
+from news.feed_cache import invalidate_feed
 
 from django.core.management.base import BaseCommand
 
+from news.services.http_client import http
+from news.services.keywords import ECON_KEYWORDS, keyword_matcher
+from news.services.indexing import mark_indexed, pending_for_index
 from news.services.qdrant_service import QdrantService
+from news.services.seen_urls import SeenUrls
+from news.services.simhash import RunSignatures, find_near_duplicate, save_signatures, simhash
+from news.services.throttle import DomainThrottle, TokenBucket
 
 
 
@@ -23,20 +36,31 @@ from news.services.qdrant_service import QdrantService
 GDELT_BASE = os.getenv("GDELT_BASE", "https://api.gdeltproject.org/api/v2/doc/doc")
 GDELT_MAX = int(os.getenv("GDELT_MAX_RECORDS", "50"))
 TOP_N = int(os.getenv("TOP_N", "20"))
+# GDELT rate limit: one request per FETCH_INTERVAL seconds, shared by all chunk workers
 FETCH_INTERVAL = int(os.getenv("FETCH_MIN_INTERVAL_SECONDS", "3"))
+GDELT_BURST = int(os.getenv("GDELT_BURST", "1"))
+GDELT_WORKERS = int(os.getenv("GDELT_WORKERS", "4"))
 ARTICLE_FETCH_TIMEOUT = int(os.getenv("ARTICLE_FETCH_TIMEOUT", "200"))
+# Minimum gap between two requests to the same domain (politeness)
 ARTICLE_FETCH_PAUSE = float(os.getenv("ARTICLE_FETCH_PAUSE_SECONDS", "0.6"))
+# Concurrent full-text extraction
+ARTICLE_FETCH_WORKERS = int(os.getenv("ARTICLE_FETCH_WORKERS", "8"))
+ARTICLE_FETCH_PER_DOMAIN = int(os.getenv("ARTICLE_FETCH_PER_DOMAIN", "2"))
 MIN_ARTICLE_LENGTH = int(os.getenv("MIN_ARTICLE_LENGTH", 300))
+# Articles written per transaction by persist_articles
+PERSIST_BATCH_SIZE = int(os.getenv("PERSIST_BATCH_SIZE", "500"))
+# A partial batch is written once it has waited this long, so early articles land quickly
+PERSIST_FLUSH_SECONDS = float(os.getenv("PERSIST_FLUSH_SECONDS", "5"))
+# Articles ranked together before the best are passed on (0 = rank the whole fetch)
+RANK_WINDOW = int(os.getenv("RANK_WINDOW", "0"))
+# Listings are only compared with signatures of articles fetched this recently, so a
+# headline that recurs later (weekly trackers, repeated wire titles) is not dropped forever
+NEAR_DUPLICATE_WINDOW_DAYS = int(os.getenv("NEAR_DUPLICATE_WINDOW_DAYS", "3"))
+HERO_IMAGE = "http://127.0.0.1:8000/static/news/llama-logo.png"
 
 # language control
 FETCH_LANGUAGE = os.getenv("FETCH_LANGUAGE", "en")  # "en" or "all"
 
-# Keywords (Job Market Focus)
-ECON_KEYWORDS = os.getenv(
-    "ECON_KEYWORDS",
-    "mass layoffs, layoffs, job cuts, workforce reduction, staff reduction, downsizing, restructuring, employee termination, hiring surge, mass hiring, recruitment drive, job openings, hiring freeze, talent acquisition, expanding workforce, unemployment, rising unemployment, labor shortage, talent shortage, job market slowdown, tech layoffs, manufacturing layoffs, corporate layoffs, hiring boom"
-)
-ECON_KEYWORDS = [k.strip() for k in ECON_KEYWORDS.split(",") if k.strip()]
 
 USER_AGENT = os.getenv(
     "FETCH_USER_AGENT",
@@ -93,7 +117,7 @@ def fetch_full_text(url, timeout=ARTICLE_FETCH_TIMEOUT):
 
     # 3) BeautifulSoup fallback
     try:
-        resp = requests.get(url, timeout=timeout, headers=headers)
+        resp = http.get(url, timeout=timeout, headers=headers, retries=0)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, "html.parser")
 
@@ -111,75 +135,282 @@ def fetch_full_text(url, timeout=ARTICLE_FETCH_TIMEOUT):
     return ""
 
 
+def extract_full_texts(items, workers=ARTICLE_FETCH_WORKERS, stats=None):
+    """
+    Yield (item, text) for every item, fetching full text concurrently
+    for items whose snippet is too short.
+    Results arrive in completion order. At most `workers * 2` fetches are
+    queued at once so a slow domain never makes us buffer the whole run.
+    """
+    if stats is None:
+        stats = {}
+    stats.update({"fetched": 0, "fetch_seconds": 0.0, "wall_seconds": 0.0})
+
+    throttle = DomainThrottle(ARTICLE_FETCH_PAUSE, ARTICLE_FETCH_PER_DOMAIN)
+    max_pending = max(1, workers) * 2
+    started = time.monotonic()
+
+    def _extract(item):
+        with throttle.slot(item["url"]):
+            t0 = time.monotonic()
+            text = fetch_full_text(item["url"])
+            return text, time.monotonic() - t0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {}
+
+        def _drain(block):
+            if not pending:
+                return
+            done, _ = wait(
+                list(pending),
+                timeout=None if block else 0,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    text, elapsed = future.result()
+                except Exception:
+                    text, elapsed = "", 0.0
+                stats["fetched"] += 1
+                stats["fetch_seconds"] += elapsed
+                yield item, text
+
+        for item in items:
+            snippet = (item.get("snippet") or "").strip()
+            if word_count(snippet) >= MIN_ARTICLE_LENGTH:
+                yield item, snippet
+                continue
+
+            while len(pending) >= max_pending:
+                yield from _drain(block=True)
+
+            pending[pool.submit(_extract, item)] = item
+            yield from _drain(block=False)
+
+        while pending:
+            yield from _drain(block=True)
+
+    stats["wall_seconds"] = time.monotonic() - started
+
+
+def extraction_summary(stats):
+    """One-line report comparing concurrent extraction with a serial run"""
+    # A serial run pays every fetch plus the old global pause after each one
+    serial = stats["fetch_seconds"] + stats["fetched"] * ARTICLE_FETCH_PAUSE
+    saved = max(0.0, serial - stats["wall_seconds"])
+    return (
+        f"Extracted {stats['fetched']} articles in {stats['wall_seconds']:.1f}s "
+        f"(serial estimate {serial:.1f}s, saved ~{saved:.1f}s)"
+    )
+
+
 def chunk_list(lst, n):
     """Yield successive n-sized chunks from lst."""
     for i in range(0, len(lst), n):
         yield lst[i:i + n]
 
-def fetch_articles():
-    """Fetch raw articles from GDELT, handling query length limits by chunking"""
-    all_articles = []
-    seen_urls = set()
-    
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+    retry=retry_if_exception_type(requests.exceptions.RequestException)
+)
+def _fetch_chunk(limiter, chunk):
+    params = {
+        "query": build_gdelt_query(chunk),
+        "mode": "artlist",
+        "format": "json",
+        "maxrecords": str(GDELT_MAX),
+    }
+
+    if FETCH_LANGUAGE != "all":
+        params["sourcelang"] = FETCH_LANGUAGE
+
+    # Every attempt (including tenacity retries) takes a token, so workers never exceed the limit
+    limiter.acquire()
+    resp = http.get(
+        GDELT_BASE,
+        params=params,
+        timeout=30,
+        headers={"User-Agent": USER_AGENT},
+        retries=0,
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+def iter_gdelt_results(workers=GDELT_WORKERS):
+    """
+    Yield raw GDELT articles chunk by chunk as each keyword query completes.
+    At most `workers` queries are in flight, so results are never fetched
+    faster than the pipeline consumes them.
+    """
     # Split keywords into chunks of 5 to avoid timeouts or query limits
-    keyword_chunks = list(chunk_list(ECON_KEYWORDS, 5))
-    
-    # Divide max records by number of chunks to keep total roughly same (or just fetch max per chunk?)
-    # Let's fetch a portion per chunk to avoid fetching too many duplicates, 
-    # but GDELT sorts by relevance/date so we want top from each topic group.
-    # We'll fetch GDELT_MAX for each chunk and then deduplicate/rank later.
-    
-    for chunk in keyword_chunks:
-        if not chunk: 
+    keyword_chunks = iter([c for c in chunk_list(ECON_KEYWORDS, 5) if c])
+
+    # Chunks are queried in parallel; the token bucket keeps us within GDELT's rate limit.
+    rate = 1.0 / FETCH_INTERVAL if FETCH_INTERVAL > 0 else None
+    limiter = TokenBucket(rate, capacity=GDELT_BURST)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {}
+
+        def submit_next():
+            chunk = next(keyword_chunks, None)
+            if chunk is not None:
+                futures[pool.submit(_fetch_chunk, limiter, chunk)] = chunk
+
+        for _ in range(max(1, workers)):
+            submit_next()
+
+        while futures:
+            done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = futures.pop(future)
+                submit_next()
+                try:
+                    data = future.result()
+                except Exception as e:
+                    print(f"Error fetching chunk {chunk} after retries: {e}")
+                    continue
+
+                yield from data.get("articles") or data.get("artlist") or []
+
+
+def normalize_articles(raw_articles):
+    for a in raw_articles:
+        yield normalize_article(a)
+
+
+def dedupe_articles(articles):
+    """Drop repeated or missing URLs; only the URLs are kept in memory"""
+    seen_urls = set()
+    for a in articles:
+        url = a.get("url")
+        if not url or url in seen_urls:
             continue
-            
-        @retry(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=1, min=4, max=10),
-            retry=retry_if_exception_type(requests.exceptions.RequestException)
-        )
-        def _fetch_chunk(chunk):
-            params = {
-                "query": build_gdelt_query(chunk),
-                "mode": "artlist",
-                "format": "json",
-                "maxrecords": str(GDELT_MAX),
-            }
-
-            if FETCH_LANGUAGE != "all":
-                params["sourcelang"] = FETCH_LANGUAGE
-
-            resp = requests.get(
-                GDELT_BASE,
-                params=params,
-                timeout=30,
-                headers={"User-Agent": USER_AGENT},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        seen_urls.add(url)
+        yield a
 
-        try:
-            data = _fetch_chunk(chunk)
-            raw_list = data.get("articles") or data.get("artlist") or []
-            
-            for a in raw_list:
-                norm = normalize_article(a)
-                if norm['url'] not in seen_urls:
-                    all_articles.append(norm)
-                    seen_urls.add(norm['url'])
-            
-            # Add delay between chunks to respect rate limits
-            if len(keyword_chunks) > 1:
-                time.sleep(FETCH_INTERVAL)
-                    
-        except Exception as e:
-            print(f"Error fetching chunk {chunk} after retries: {e}")
+
+def skip_seen_urls(articles, seen, stats=None):
+    """Drop URLs an earlier run already saved or rejected, before any download"""
+    if stats is None:
+        stats = {}
+    stats.setdefault(SeenUrl.SAVED, 0)
+    stats.setdefault(SeenUrl.REJECTED, 0)
+    for a in articles:
+        row = seen.should_skip(a["url"])
+        if row is not None:
+            stats[row.status] += 1
             continue
+        yield a
+
+
+# "Headline - Reuters", "Headline | Yahoo Finance": syndicated copies differ only in this suffix
+SOURCE_SUFFIX_RE = re.compile(r"\s+[-|\u2013\u2014]\s+((?:[\w.&']+\s?){1,4})$")
+
 
-    return all_articles
+def _squash(text):
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+
+def _drop_the(name):
+    return name[3:] if name.startswith("the") and len(name) > 6 else name
+
+
+def _squash_labels(domain):
+    # "www.theguardian.co.uk" -> ["guardian", "co"]: no www, no TLD, no leading "the"
+    labels = [_squash(l) for l in domain.lower().split(".")]
+    labels = [l for l in labels[:-1] if l and l != "www"] or labels
+    return [_drop_the(l) for l in labels]
+
+
+def strip_source_suffix(title, source):
+    """
+    Drop a trailing " - Publisher" only when it names the article's own
+    source domain ("Yahoo Finance" for finance.yahoo.com), so headlines
+    like "Layoffs hit tech - and finance" keep their last words.
+    """
+    match = SOURCE_SUFFIX_RE.search(title)
+    if not match or not source:
+        return title
+    suffix = _drop_the(_squash(match.group(1)))
+    labels = [l for l in _squash_labels(source) if len(l) >= 3]
+    if len(suffix) >= 3 and any(suffix.startswith(l) or l.startswith(suffix) for l in labels):
+        return title[:match.start()]
+    return title
+
+
+def drop_near_duplicates(articles, stats=None):
+    """
+    Skip syndicated copies of a story before any full text is fetched.
+    GDELT artlist records carry no snippet, so this is in practice a SimHash
+    of the headline (without its source suffix). It is checked against
+    earlier articles in this run and the signatures of articles fetched in
+    the last NEAR_DUPLICATE_WINDOW_DAYS.
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault("near_duplicates", 0)
+    run = RunSignatures()
+    recent = ArticleSignature.objects.filter(
+        article__fetched_at__gte=timezone.now() - timedelta(days=NEAR_DUPLICATE_WINDOW_DAYS)
+    )
+
+    for a in articles:
+        title = strip_source_suffix(a["title"], a.get("source"))
+        h = simhash(f"{title} {a['snippet']}")
+        if h is not None:
+            # A re-fetch of the same URL is not a duplicate of itself
+            stored = recent.exclude(article__url=a["url"])
+            if run.find(h) is not None or find_near_duplicate(
+                ArticleSignature.LISTING, h, queryset=stored
+            ) is not None:
+                stats["near_duplicates"] += 1
+                continue
+            run.add(a["url"], h)
+            a["listing_simhash"] = h
+        yield a
+
+
+def expected_results():
+    """Upper bound on GDELT results per run: GDELT_MAX for each keyword chunk"""
+    return GDELT_MAX * len([c for c in chunk_list(ECON_KEYWORDS, 5) if c])
+
+
+def rank_window(articles, window=RANK_WINDOW, top_n=TOP_N, expected_total=None):
+    """
+    Rank articles with rank_articles and pass on the best `top_n`.
+    window=0 (default) ranks the whole stream at once: exact top-N, but
+    nothing flows until GDELT is done. With a window, each window may only
+    contribute its share of top_n (top_n * window / expected_total), so
+    whichever chunk arrives first can't take every slot; the last window
+    fills whatever is left.
+    """
+    per_window = top_n
+    if window and expected_total:
+        per_window = max(1, math.ceil(top_n * window / expected_total))
 
+    emitted = 0
+    buffer = []
 
+    def flush(limit):
+        nonlocal emitted
+        for a in rank_articles(buffer)[:min(limit, top_n - emitted)]:
+            emitted += 1
+            yield a
+        buffer.clear()
 
+    for a in articles:
+        buffer.append(a)
+        if window and len(buffer) >= window:
+            yield from flush(per_window)
+            if emitted >= top_n:
+                return
+    if buffer:
+        yield from flush(top_n)
 
 
 def rank_articles(articles):
@@ -189,8 +420,7 @@ def rank_articles(articles):
     ranked = []
 
     for a in articles:
-        combined = (a["title"] + " " + a["snippet"]).lower()
-        if not any(k in combined for k in ECON_KEYWORDS):
+        if not keyword_matcher.contains_any(a["title"] + " " + a["snippet"]):
             continue
 
         ranked.append({
@@ -258,101 +488,309 @@ def parse_published_at(raw):
 
 
 
+def matched_keywords(text):
+    """ECON_KEYWORDS found in text, from a single pass of the shared matcher"""
+    return keyword_matcher.matched(text)
+
+
 def assign_topics(article, text):
     """
     Attach Topic objects to an article based on keyword matching.
     """
-    text = text.lower()
     assigned = []
 
-    for keyword in ECON_KEYWORDS:
-        if keyword.lower() in text:
-            topic, created = Topic.objects.get_or_create(
-                name=keyword,
-                defaults={'slug': slugify(keyword)}
-            )
-            article.topics.add(topic)
-            assigned.append(topic.name)
+    for keyword in matched_keywords(text):
+        topic, created = Topic.objects.get_or_create(
+            name=keyword,
+            defaults={'slug': slugify(keyword)}
+        )
+        article.topics.add(topic)
+        assigned.append(topic.name)
     
     return assigned
 
 
+@contextmanager
+def count_queries(stats):
+    """Count SQL statements run on this thread's connection into stats["queries"]"""
+    def wrapper(execute, sql, params, many, context):
+        stats["queries"] = stats.get("queries", 0) + 1
+        return execute(sql, params, many, context)
 
+    with connection.execute_wrapper(wrapper):
+        yield
 
 
+def persist_articles(rows, stats=None, seen=None):
+    """
+    Write a batch of extracted articles in one transaction with a fixed
+    number of queries, instead of several autocommitted queries per article.
+    rows: dicts with url, source, title, snippet, published_at.
+    Returns (saved Article instances, number newly created).
+
+    Bulk writes skip post_save, so the feed cache is invalidated here.
+    With `seen`, the URLs are also recorded as saved for later runs.
+    """
+    if stats is None:
+        stats = {}
+    if not rows:
+        return [], 0
+
+    urls = [r["url"] for r in rows]
+    t0 = time.monotonic()
+
+    with count_queries(stats), transaction.atomic():
+        existing = set(
+            Article.objects.filter(url__in=urls).values_list("url", flat=True)
+        )
+
+        # Insert new rows and update existing ones in a single statement
+        Article.objects.bulk_create(
+            [
+                Article(
+                    url=r["url"],
+                    source=r["source"],
+                    title=r["title"],
+                    snippet=r["snippet"],
+                    published_at=r["published_at"],
+                )
+                for r in rows
+            ],
+            update_conflicts=True,
+            unique_fields=["url"],
+            update_fields=["source", "title", "snippet", "published_at"],
+        )
+        by_url = Article.objects.in_bulk(urls, field_name="url")
+        articles = [by_url[url] for url in urls]
+
+        # Near-duplicate signatures computed before extraction (drop_near_duplicates)
+        save_signatures(ArticleSignature.LISTING, {
+            by_url[r["url"]].id: r.get("listing_simhash") for r in rows
+        })
+        if seen is not None:
+            seen.record(SeenUrl.SAVED, {r["url"]: word_count(r["snippet"]) for r in rows})
+
+        # Topics: one lookup, one insert for the missing ones, one through-table insert
+        keywords = {
+            a.id: matched_keywords(f"{a.title} {a.snippet}") for a in articles
+        }
+        names = {k for ks in keywords.values() for k in ks}
+        topics = {t.name: t for t in Topic.objects.filter(name__in=names)}
+        missing = names - topics.keys()
+        if missing:
+            Topic.objects.bulk_create(
+                [Topic(name=name, slug=slugify(name)) for name in missing],
+                ignore_conflicts=True,
+            )
+            topics.update(
+                (t.name, t) for t in Topic.objects.filter(name__in=missing)
+            )
+
+        Through = Article.topics.through
+        Through.objects.bulk_create(
+            [
+                Through(article_id=article_id, topic_id=topics[name].id)
+                for article_id, ks in keywords.items()
+                for name in ks
+                if name in topics
+            ],
+            ignore_conflicts=True,
+        )
+
+        # (Re)set every page to pending so summarize_news picks it up
+        SummaryPage.objects.bulk_create(
+            [
+                SummaryPage(
+                    article=a,
+                    hero_image=HERO_IMAGE,
+                    short_preview=a.snippet[:200],
+                    ai_summary=a.snippet,
+                    summarized_at=None,
+                    model_version="",
+                    confidence=None,
+                    claimed_by="",
+                    claimed_at=None,
+                )
+                for a in articles
+            ],
+            update_conflicts=True,
+            unique_fields=["article"],
+            update_fields=[
+                "hero_image", "short_preview", "ai_summary", "summarized_at",
+                "model_version", "confidence", "claimed_by", "claimed_at",
+            ],
+        )
+
+    invalidate_feed()
+
+    stats["persisted"] = stats.get("persisted", 0) + len(articles)
+    stats["persist_seconds"] = stats.get("persist_seconds", 0.0) + time.monotonic() - t0
+    return articles, len(set(urls) - existing)
 
-def save_articles(articles, stdout):
-    qdrant = QdrantService()
-    try:
-        qdrant.ensure_collection()
-    except Exception as e:
-        stdout.write(f"Warning: Could not connect to Qdrant: {e}")
-        # We continue even if Qdrant fails, so we don't block DB saving
-        qdrant = None
 
-    saved = 0
-    seen = set()
 
-    for item in articles:
-        url = item.get("url")
-        if not url or url in seen:
-            continue
-        seen.add(url)
 
-        title = (item.get("title") or "")[:300]
-        snippet = (item.get("snippet") or "").strip()
-        published_at = parse_published_at(item.get("published_at_raw"))
 
-        # Try fetching full content if snippet is too short
-        if word_count(snippet) < MIN_ARTICLE_LENGTH:
-            fetched = fetch_full_text(url)
-            if word_count(fetched) >= MIN_ARTICLE_LENGTH:
-                snippet = fetched
-            time.sleep(ARTICLE_FETCH_PAUSE)
+
+class PipelineStats:
+    """
+    Items and time per fetch_news stage. Each stage is a generator pulling
+    from the previous one, so a stage's own time is its cumulative time
+    minus that of the stage before it.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.stages = {}
+        self.first_saved_after = None
+
+    def timed(self, name, iterable):
+        # Registered now, not on first next(), so stages report in pipeline order
+        stage = self.stages.setdefault(name, {"items": 0, "seconds": 0.0})
+        return self._timed(stage, iter(iterable))
+
+    @staticmethod
+    def _timed(stage, it):
+        while True:
+            t0 = time.monotonic()
+            try:
+                item = next(it)
+            except StopIteration:
+                stage["seconds"] += time.monotonic() - t0
+                return
+            stage["seconds"] += time.monotonic() - t0
+            stage["items"] += 1
+            yield item
+
+    def saved(self):
+        if self.first_saved_after is None:
+            self.first_saved_after = time.monotonic() - self.started
+
+    def report(self):
+        lines = []
+        previous = 0.0
+        for name, stage in self.stages.items():
+            own = max(0.0, stage["seconds"] - previous)
+            previous = stage["seconds"]
+            lines.append(f"  {name:<10} {stage['items']:>6} items  {own:7.2f}s")
+        if self.first_saved_after is not None:
+            lines.append(f"  first articles saved after {self.first_saved_after:.1f}s")
+        lines.append(f"  total {time.monotonic() - self.started:.1f}s")
+        return "\n".join(lines)
+
+
+def persist_stage(extracted, stdout, db_stats, seen=None, batch_size=PERSIST_BATCH_SIZE,
+                  flush_seconds=PERSIST_FLUSH_SECONDS):
+    """
+    Skip low-quality texts and write the rest with persist_articles.
+    Yields (articles, created) per batch; a batch is written when it is full
+    or its oldest row has waited `flush_seconds`. Rejected URLs are
+    remembered in `seen` so later runs don't download them again.
+    """
+    batch = []
+    rejected = {}
+    oldest = None
+
+    for item, snippet in extracted:
+        title = (item.get("title") or "")[:300]
 
         # Skip low-quality articles
         if word_count(snippet) < MIN_ARTICLE_LENGTH:
             stdout.write(
                 f" SKIPPED (low quality {word_count(snippet)} words): {title[:80]}"
             )
+            rejected[item["url"]] = word_count(snippet)
             continue
 
-        # Save / update Article
-        article_obj, created = Article.objects.update_or_create(
-            url=url,
-            defaults={
-                "source": item.get("source") or "gdelt",
-                "title": title,
-                "snippet": snippet,
-                "published_at": published_at,
-            }
-        )
+        batch.append({
+            "url": item["url"],
+            "source": item.get("source") or "gdelt",
+            "title": title,
+            "snippet": snippet,
+            "published_at": parse_published_at(item.get("published_at_raw")),
+            "listing_simhash": item.get("listing_simhash"),
+        })
+        if oldest is None:
+            oldest = time.monotonic()
+
+        if len(batch) >= batch_size or time.monotonic() - oldest >= flush_seconds:
+            yield persist_articles(batch, db_stats, seen)
+            batch = []
+            oldest = None
+
+    if batch:
+        yield persist_articles(batch, db_stats, seen)
+    if seen is not None:
+        seen.record(SeenUrl.REJECTED, rejected)
+
+
+def index_stage(batches, qdrant, stdout, index_stats):
+    """Embed and upsert each persisted batch; yields (articles, created)"""
+    index_stats.update({"pending": 0, "indexed": 0})
+    for articles, created in batches:
+        if qdrant and articles:
+            # New and changed articles are embedded and upserted in batches
+            to_index = pending_for_index(articles)
+            try:
+                indexed_ids = set(qdrant.upsert_articles(to_index))
+                mark_indexed([a for a in to_index if a.id in indexed_ids])
+                index_stats["pending"] += len(to_index)
+                index_stats["indexed"] += len(indexed_ids)
+            except Exception as e:
+                stdout.write(f"Failed to index articles: {e}")
+        yield articles, created
+
+
+def connect_qdrant(stdout):
+    try:
+        qdrant = QdrantService()
+        qdrant.ensure_collection()
+        return qdrant
+    except Exception as e:
+        stdout.write(f"Warning: Could not connect to Qdrant: {e}")
+        # We continue even if Qdrant fails, so we don't block DB saving
+        return None
 
-        # ASSIGN TOPICS HERE (CRITICAL FIX)
-        combined_text = f"{article_obj.title} {article_obj.snippet}"
-        assign_topics(article_obj, combined_text)
-
-        # Create / update SummaryPage
-        SummaryPage.objects.update_or_create(
-            article=article_obj,
-            defaults={
-                "hero_image": "http://127.0.0.1:8000/static/news/llama-logo.png",
-                "short_preview": snippet[:200],
-                "ai_summary": snippet,
-                "summarized_at": None,
-                "model_version": "",
-                "confidence": None,
-            }
-        )
 
-        if created:
-            saved += 1
-            if qdrant:
-                try:
-                    qdrant.upsert_article(article_obj)
-                except Exception as e:
-                    stdout.write(f"Failed to index article {article_obj.id}: {e}")
+def run_pipeline(articles, stdout, workers=ARTICLE_FETCH_WORKERS, pipeline=None, seen=None):
+    """
+    extract -> persist -> index over an iterable of normalized articles.
+    Everything is pulled lazily, so the first batch is saved and indexed
+    while later articles are still being fetched. Outcomes are recorded
+    in `seen` (loaded if not given). Returns the number of newly created
+    articles.
+    """
+    if pipeline is None:
+        pipeline = PipelineStats()
+    if seen is None:
+        seen = SeenUrls.load()
+    qdrant = connect_qdrant(stdout)
+
+    extract_stats, db_stats, index_stats = {}, {}, {}
+    # Full text for short snippets is fetched concurrently, DB writes stay on this thread
+    extracted = pipeline.timed(
+        "extract", extract_full_texts(articles, workers=workers, stats=extract_stats)
+    )
+    persisted = pipeline.timed("persist", persist_stage(extracted, stdout, db_stats, seen))
+    indexed = pipeline.timed("index", index_stage(persisted, qdrant, stdout, index_stats))
 
+    saved = 0
+    for _, created in indexed:
+        pipeline.saved()
+        saved += created
+    seen.save()
+
+    stdout.write(extraction_summary(extract_stats))
+    if db_stats:
+        stdout.write(
+            f"Persisted {db_stats['persisted']} articles with {db_stats['queries']} queries "
+            f"in {db_stats['persist_seconds']:.2f}s"
+        )
+    if qdrant and index_stats["pending"]:
+        stdout.write(
+            f"Indexed {index_stats['indexed']}/{index_stats['pending']} "
+            "new or changed articles in Qdrant."
+        )
     return saved
 
 
@@ -362,13 +800,62 @@ def save_articles(articles, stdout):
 class Command(BaseCommand):
     help = "Fetch top economic news and save to DB"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=ARTICLE_FETCH_WORKERS,
+            help="Number of concurrent full-text extraction workers",
+        )
+        parser.add_argument(
+            "--gdelt-workers",
+            type=int,
+            default=GDELT_WORKERS,
+            help="Number of keyword chunks queried in parallel",
+        )
+        parser.add_argument(
+            "--rank-window",
+            type=int,
+            default=RANK_WINDOW,
+            help="Articles ranked together before their share of TOP_N moves on (0 = rank the whole fetch)",
+        )
+        parser.add_argument(
+            "--no-seen-check",
+            action="store_true",
+            help="Re-extract URLs that earlier runs already saved or rejected",
+        )
+
     def handle(self, *args, **options):
         self.stdout.write("Fetching articles from GDELT...")
 
-        articles = fetch_articles()
-        ranked = rank_articles(articles)
-        saved = save_articles(ranked, self.stdout)
+        # fetch -> normalize -> dedupe -> seen -> near-dup -> rank -> extract -> persist -> index, all streaming
+        pipeline = PipelineStats()
+        raw = pipeline.timed("fetch", iter_gdelt_results(workers=options["gdelt_workers"]))
+        normalized = pipeline.timed("normalize", normalize_articles(raw))
+        unique = pipeline.timed("dedupe", dedupe_articles(normalized))
+        seen = SeenUrls.load()
+        seen_stats = {}
+        if not options["no_seen_check"]:
+            unique = pipeline.timed("seen", skip_seen_urls(unique, seen, seen_stats))
+        dup_stats = {}
+        distinct = pipeline.timed("near-dup", drop_near_duplicates(unique, dup_stats))
+        ranked = pipeline.timed("rank", rank_window(
+            distinct, window=options["rank_window"], expected_total=expected_results()
+        ))
+        saved = run_pipeline(
+            ranked, self.stdout, workers=options["workers"], pipeline=pipeline, seen=seen
+        )
+
+        if seen_stats:
+            self.stdout.write(
+                f"Skipped {seen_stats[SeenUrl.SAVED]} already saved and "
+                f"{seen_stats[SeenUrl.REJECTED]} previously rejected URLs "
+                f"({seen.stats['db_checks']} DB checks, {seen.stats['bloom_negative']} answered by the Bloom filter)."
+            )
+        self.stdout.write(f"Skipped {dup_stats['near_duplicates']} near-duplicate articles before extraction.")
 
+        self.stdout.write("Pipeline stages:\n" + pipeline.report())
+        self.stdout.write("Upstream HTTP:\n" + http.format_metrics())
         self.stdout.write(
             self.style.SUCCESS(f"Fetch complete — saved {saved} articles.")
         )
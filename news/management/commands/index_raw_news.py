@@ -1,26 +1,124 @@
-from django.core.management.base import BaseCommand
+from dateutil import parser as date_parser
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
 from news.models import Article
-from news.services.qdrant_service import QdrantService
+from news.services.indexing import mark_indexed, needs_indexing
+from news.services.qdrant_service import QdrantService, UPSERT_BATCH_SIZE, batched
 from tqdm import tqdm
 
 class Command(BaseCommand):
-    help = "Index all existing articles into Qdrant"
+    help = (
+        "Index new or changed articles into Qdrant. "
+        "Progress is saved after every batch, so an interrupted run resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=UPSERT_BATCH_SIZE,
+            help="Articles embedded and upserted per Qdrant request",
+        )
+        parser.add_argument(
+            "--no-wait",
+            action="store_true",
+            help="Don't wait for Qdrant to apply each batch before sending the next",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only consider articles fetched on or after this date (e.g. 2026-01-31)",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Reindex every article, ignoring saved index state",
+        )
+        parser.add_argument(
+            "--apply-config",
+            action="store_true",
+            help=(
+                "Apply the QDRANT_* storage settings (quantization, on-disk vectors, HNSW) "
+                "to the existing collection before indexing"
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many articles would be indexed without calling Gemini or Qdrant",
+        )
 
     def handle(self, *args, **options):
-        self.stdout.write("Initializing Qdrant service...")
-        qdrant = QdrantService()
-        qdrant.ensure_collection()
+        batch_size = options["batch_size"]
+        full = options["full"]
+        dry_run = options["dry_run"]
+
+        articles = Article.objects.select_related("index_state").order_by("id")
+        if options["since"]:
+            try:
+                since = date_parser.parse(options["since"])
+            except (ValueError, OverflowError):
+                raise CommandError(f"Invalid --since date: {options['since']}")
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            articles = articles.filter(fetched_at__gte=since)
+
+        qdrant = None
+        if not dry_run:
+            self.stdout.write("Initializing Qdrant service...")
+            qdrant = QdrantService()
+            if qdrant.ensure_collection():
+                if not full:
+                    # Saved state describes a collection that no longer exists
+                    self.stdout.write(self.style.WARNING("Collection was (re)created, switching to full reindex."))
+                    full = True
+            elif options["apply_config"]:
+                # A new collection already has them; an existing one keeps its old layout
+                qdrant.apply_collection_config()
+                self.stdout.write(
+                    f"Applied quantization={qdrant.quantization} to {qdrant.collection_name}; "
+                    "Qdrant re-optimizes segments in the background."
+                )
 
-        articles = Article.objects.all()
         total = articles.count()
-        self.stdout.write(f"Found {total} articles to index.")
+        self.stdout.write(f"Found {total} articles to check.")
 
+        pending_count = 0
         success_count = 0
-        for article in tqdm(articles, desc="Indexing articles"):
-            try:
-                if qdrant.upsert_article(article):
-                    success_count += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Failed to index article {article.id}: {e}"))
+        with tqdm(total=total, desc="Indexing articles") as progress:
+            for batch in batched(articles.iterator(chunk_size=batch_size), batch_size):
+                progress.update(len(batch))
+
+                pending = [
+                    a for a in batch
+                    if full or needs_indexing(a, getattr(a, "index_state", None))
+                ]
+                pending_count += len(pending)
+                if not pending or dry_run:
+                    continue
+
+                try:
+                    indexed_ids = set(qdrant.upsert_articles(
+                        pending,
+                        batch_size=batch_size,
+                        wait=not options["no_wait"],
+                    ))
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(
+                        f"Failed to index articles {pending[0].id}-{pending[-1].id}: {e}"
+                    ))
+                    continue
+
+                # Checkpoint: a crash after this point won't redo this batch
+                mark_indexed([a for a in pending if a.id in indexed_ids])
+                success_count += len(indexed_ids)
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f"Dry run: {pending_count}/{total} articles would be indexed."
+            ))
+            return
 
-        self.stdout.write(self.style.SUCCESS(f"Successfully indexed {success_count}/{total} articles."))
+        self.stdout.write(self.style.SUCCESS(
+            f"Successfully indexed {success_count}/{pending_count} articles "
+            f"({total - pending_count} unchanged, skipped)."
+        ))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from news.services.comparisons import precompute_popular_comparisons
+
+
+class Command(BaseCommand):
+    help = "Regenerate stale or missing career comparisons for the most popular pairs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of most requested comparisons to keep fresh",
+        )
+        parser.add_argument(
+            "--pair",
+            action="append",
+            default=[],
+            help='Extra pair to precompute, e.g. --pair "Data Scientist:AI Engineer" (repeatable)',
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate even if the cached comparison is still fresh",
+        )
+
+    def handle(self, *args, **options):
+        pairs = []
+        for raw in options["pair"]:
+            career1, sep, career2 = raw.partition(":")
+            if not sep or not career1.strip() or not career2.strip():
+                raise CommandError(f'Invalid --pair "{raw}", expected "Career 1:Career 2"')
+            pairs.append((career1.strip(), career2.strip()))
+
+        refreshed = precompute_popular_comparisons(
+            top=options["top"], pairs=pairs, force=options["force"]
+        )
+        for a, b in refreshed:
+            self.stdout.write(f"  refreshed: {a} vs {b}")
+
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {len(refreshed)} comparison(s)."))
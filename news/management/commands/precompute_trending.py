@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from news.services.adzuna import ADZUNA_COUNTRIES, TRENDING_CATEGORIES
+from news.services.trending import TRENDING_COUNTRIES, precompute_trending_snapshots
+
+
+def split_csv(value):
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+class Command(BaseCommand):
+    help = "Precompute trending job stats from Adzuna and store a snapshot per country"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--countries",
+            default=",".join(TRENDING_COUNTRIES),
+            help="Comma separated Adzuna country codes (default: TRENDING_COUNTRIES)",
+        )
+        parser.add_argument(
+            "--categories",
+            default=",".join(TRENDING_CATEGORIES),
+            help="Comma separated job categories to track",
+        )
+
+    def handle(self, *args, **options):
+        countries = [c.lower() for c in split_csv(options["countries"])]
+        categories = split_csv(options["categories"])
+        if not countries or not categories:
+            raise CommandError("At least one country and one category are required")
+
+        unknown = sorted(set(countries) - ADZUNA_COUNTRIES)
+        if unknown:
+            raise CommandError(
+                f"Not Adzuna country codes: {', '.join(unknown)} "
+                f"(expected one of {', '.join(sorted(ADZUNA_COUNTRIES))})"
+            )
+
+        self.stdout.write(f"Precomputing trending stats for {', '.join(countries)}...")
+        snapshots = precompute_trending_snapshots(countries, categories)
+
+        for snapshot in snapshots:
+            self.stdout.write(f"  {snapshot.country}: {len(snapshot.stats)} categories")
+
+        # Non-zero exit lets a scheduler notice when nothing could be refreshed
+        if not snapshots:
+            raise CommandError("No snapshots saved (Adzuna unavailable or credentials missing)")
+
+        self.stdout.write(self.style.SUCCESS(f"Saved {len(snapshots)} trending snapshot(s)."))
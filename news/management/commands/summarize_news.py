@@ -1,13 +1,22 @@
 import os
-import requests
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
 from django.utils import timezone
 
-from news.models import SummaryPage
+from news.models import ArticleSignature, SummaryPage
+from news.services.http_client import http
+from news.services.simhash import find_near_duplicate, save_signatures, simhash
 
 
 
-# Number of database rows loaded into memory at a time
+# Number of pending rows read per claim attempt
 CHUNK_SIZE = int(os.getenv("AI_SUMMARY_DB_CHUNK_SIZE", 3))
 
 
@@ -28,33 +37,88 @@ MODEL_NAME = "llama3.1:8b"
 # Wait maximum 5 minutes for response generation for saving to db
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT","600"))
 
-def generate_summary(text: str) -> str:
+# Worker threads; match the server's OLLAMA_NUM_PARALLEL so requests don't just queue
+SUMMARY_WORKERS = int(os.getenv("OLLAMA_NUM_PARALLEL", "1"))
+# A claim older than this is considered abandoned (crashed worker) and can be taken over
+CLAIM_TIMEOUT = int(os.getenv("AI_SUMMARY_CLAIM_TIMEOUT_SECONDS", str(REQUEST_TIMEOUT * 2)))
+
+# Send the fixed instructions through the system prompt slot and keep the model
+# loaded between articles, so Ollama reuses the evaluated prefix instead of redoing it
+PROMPT_PREFIX_CACHE = os.getenv("AI_SUMMARY_PREFIX_CACHE", "True") == "True"
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+
+def request_summary(text: str, cache_prefix=None, options=None) -> dict:
+    """
+    Call Ollama and return the full JSON response
+    (response text plus eval_count / prompt_eval_count timings).
+    """
+    if cache_prefix is None:
+        cache_prefix = PROMPT_PREFIX_CACHE
+
     payload = {
         "model": MODEL_NAME,
-        "prompt": build_prompt(text),
         "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
         "options": {
             "temperature": 0.3,
-            "top_p": 0.9
+            "top_p": 0.9,
+            **(options or {}),
         }
     }
 
-    response = requests.post(
+    if cache_prefix:
+        payload["system"] = SUMMARY_INSTRUCTIONS
+        payload["prompt"] = text
+    else:
+        payload["prompt"] = build_prompt(text)
+
+    response = http.post(
         OLLAMA_URL,
         json=payload,
         timeout=REQUEST_TIMEOUT
     )
 
     response.raise_for_status()
-    return (response.json().get("response") or "").strip()
+    return response.json()
 
 
-#Local LLM Prompt
-def build_prompt(text: str) -> str:
+def generate_summary(text: str) -> str:
+    return (request_summary(text).get("response") or "").strip()
+
+
+def claim_next(worker_id):
     """
-    Strict structured prompt for Job Market Trend analysis.
+    Atomically claim one pending SummaryPage for this worker.
+    The conditional UPDATE only succeeds for one worker (or process) per row.
     """
-    return f"""
+    stale_before = timezone.now() - timedelta(seconds=CLAIM_TIMEOUT)
+    claimable = Q(claimed_at__isnull=True) | Q(claimed_at__lt=stale_before)
+
+    while True:
+        candidates = list(
+            SummaryPage.objects.filter(summarized_at__isnull=True)
+            .filter(claimable)
+            .order_by("id")
+            .values_list("id", flat=True)[:CHUNK_SIZE]
+        )
+        if not candidates:
+            return None
+
+        for pk in candidates:
+            updated = (
+                SummaryPage.objects.filter(pk=pk, summarized_at__isnull=True)
+                .filter(claimable)
+                .update(claimed_by=worker_id, claimed_at=timezone.now())
+            )
+            if updated:
+                return SummaryPage.objects.select_related("article").get(pk=pk)
+
+
+#Local LLM Prompt
+# Static part of the prompt (~2KB). Sent as the system prompt so Ollama evaluates it
+# once per loaded model slot and reuses the cached prefix for every article.
+SUMMARY_INSTRUCTIONS = """
 You are a Senior Job Market Analyst.
 
 TASK:
@@ -259,8 +323,16 @@ INPUT NEWS:
 <PASTE RAW NEWS HERE>
 
 NOW GENERATE THE MARKDOWN ARTICLE.
+"""
 
 
+def build_prompt(text: str) -> str:
+    """
+    Strict structured prompt for Job Market Trend analysis.
+    Single-string form (instructions + article), used when prefix caching is off.
+    """
+    return f"""{SUMMARY_INSTRUCTIONS}
+
 {text}
 """
 
@@ -269,55 +341,141 @@ NOW GENERATE THE MARKDOWN ARTICLE.
 class Command(BaseCommand):
     help = "Generate AI summaries using local LLM"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=SUMMARY_WORKERS,
+            help="Concurrent Ollama requests (defaults to OLLAMA_NUM_PARALLEL)",
+        )
+
     def handle(self, *args, **options):
         self.stdout.write(" ---> Starting AI summarization...")
 
-        # Select those summarized_at column where __isnull, and select related article.
-        pending_qs = SummaryPage.objects.filter(
-            summarized_at__isnull=True
-        ).select_related("article")
-
         # Check at least one article without ai summary exists, if not return
-        if not pending_qs.exists():
+        if not SummaryPage.objects.filter(summarized_at__isnull=True).exists():
             self.stdout.write(self.style.SUCCESS(" No pending articles."))
             return
 
-        for summary_page in pending_qs.iterator(CHUNK_SIZE):
-            article = summary_page.article
-            text = (article.snippet or "").strip()
-
-            # -----> Skip articles with less than 300 WORDS 
-            if word_count(text) < 300:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f" SKIPPED (short article, {word_count(text)} words): "
-                        f"{article.title[:80]}"
-                    )
-                )
-                continue
-
-
-
-            try:
-                self.stdout.write(f"{MODEL_NAME} --- Processing: {article.title[:80]}")
-
-                ai_summary = generate_summary(text)
-
-                if not ai_summary:
-                    raise ValueError("Empty AI response")
-                #loopvar.field
-                summary_page.ai_summary = ai_summary
-                summary_page.summarized_at = timezone.now()
-                summary_page.model_version = MODEL_NAME
-                summary_page.confidence = 0.85
-                summary_page.save()
-
-                self.stdout.write(self.style.SUCCESS("✔ Summary saved"))
+        workers = max(1, options["workers"])
+        self.stats = {"summarized": 0, "failed": 0, "skipped": 0, "duplicates": 0, "eval_tokens": 0}
+        self.stats_lock = threading.Lock()
+        self.failed_ids = []
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for n in range(workers):
+                pool.submit(self.run_worker, f"{prefix}:{n}")
+        elapsed = time.monotonic() - started
+
+        # Release rows whose LLM call failed so the next run retries them instead of
+        # waiting out CLAIM_TIMEOUT (released only now, or this run would loop on them)
+        if self.failed_ids:
+            SummaryPage.objects.filter(
+                pk__in=self.failed_ids,
+                summarized_at__isnull=True,
+                claimed_by__startswith=f"{prefix}:",
+            ).update(claimed_by="", claimed_at=None)
+
+        stats = self.stats
+        per_min = stats["summarized"] / (elapsed / 60) if elapsed else 0.0
+        tok_per_s = stats["eval_tokens"] / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"Summarized {stats['summarized']} (failed {stats['failed']}, "
+            f"skipped {stats['skipped']}, copied from near-duplicates {stats['duplicates']}) in {elapsed:.1f}s with {workers} worker(s): "
+            f"{per_min:.1f} articles/min, {tok_per_s:.1f} tokens/s"
+        )
+        self.stdout.write("Ollama HTTP:\n" + http.format_metrics())
+        self.stdout.write(self.style.SUCCESS("AI summarization completed."))
 
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f" AI failed, skipping article: {str(e)}")
+    def count(self, key, n=1):
+        with self.stats_lock:
+            self.stats[key] += n
+
+    def run_worker(self, worker_id):
+        try:
+            while True:
+                summary_page = claim_next(worker_id)
+                if summary_page is None:
+                    return
+                self.process(summary_page)
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f" Worker {worker_id} stopped: {e}"))
+        finally:
+            # Each thread opened its own DB connection
+            connection.close()
+
+    def process(self, summary_page):
+        article = summary_page.article
+        text = (article.snippet or "").strip()
+
+        # -----> Skip articles with less than 300 WORDS 
+        # (the claim stays until it expires, so this run won't pick it up again)
+        if word_count(text) < 300:
+            self.stdout.write(
+                self.style.WARNING(
+                    f" SKIPPED (short article, {word_count(text)} words): "
+                    f"{article.title[:80]}"
                 )
-                continue
+            )
+            self.count("skipped")
+            return
 
-        self.stdout.write(self.style.SUCCESS("AI summarization completed."))
+        # Same story already summarized under another URL: reuse it instead of calling the LLM
+        text_hash = simhash(text)
+        if text_hash is not None and self.copy_duplicate(summary_page, text_hash):
+            return
+
+        try:
+            self.stdout.write(f"{MODEL_NAME} --- Processing: {article.title[:80]}")
+
+            result = request_summary(text)
+            ai_summary = (result.get("response") or "").strip()
+
+            if not ai_summary:
+                raise ValueError("Empty AI response")
+            #loopvar.field
+            summary_page.ai_summary = ai_summary
+            summary_page.summarized_at = timezone.now()
+            summary_page.model_version = MODEL_NAME
+            summary_page.confidence = 0.85
+            summary_page.save()
+            save_signatures(ArticleSignature.TEXT, {article.id: text_hash})
+
+            self.count("summarized")
+            self.count("eval_tokens", result.get("eval_count") or 0)
+            self.stdout.write(self.style.SUCCESS("✔ Summary saved"))
+
+        except Exception as e:
+            self.count("failed")
+            with self.stats_lock:
+                self.failed_ids.append(summary_page.pk)
+            self.stdout.write(
+                self.style.ERROR(f" AI failed, skipping article: {str(e)}")
+            )
+
+    def copy_duplicate(self, summary_page, text_hash):
+        summarized = ArticleSignature.objects.filter(article__summary__summarized_at__isnull=False)
+        original_id = find_near_duplicate(
+            ArticleSignature.TEXT,
+            text_hash,
+            exclude_article_ids=[summary_page.article_id],
+            queryset=summarized,
+        )
+        if original_id is None:
+            return False
+
+        original = SummaryPage.objects.get(article_id=original_id)
+        summary_page.ai_summary = original.ai_summary
+        summary_page.summarized_at = timezone.now()
+        summary_page.model_version = original.model_version
+        summary_page.confidence = original.confidence
+        summary_page.save()
+
+        self.count("duplicates")
+        self.stdout.write(
+            f" NEAR-DUPLICATE of article {original_id}, summary copied: "
+            f"{summary_page.article.title[:80]}"
+        )
+        return True
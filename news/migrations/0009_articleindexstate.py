@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0008_delete_userpreference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleIndexState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64)),
+                ('embedding_model', models.CharField(max_length=64)),
+                ('indexed_at', models.DateTimeField()),
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='index_state', to='news.article')),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0009_articleindexstate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summarypage',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='summarypage',
+            name='claimed_by',
+            field=models.CharField(blank=True, max_length=128),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0010_summarypage_claim'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-published_at', '-id'], name='article_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='summarypage',
+            index=models.Index(condition=models.Q(('summarized_at__isnull', True)), fields=['id'], name='summary_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0012_trendingsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CareerComparison',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('career_a', models.CharField(max_length=200)),
+                ('career_b', models.CharField(max_length=200)),
+                ('result', models.JSONField()),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('career_a', 'career_b'), name='unique_career_pair')],
+            },
+        ),
+    ]
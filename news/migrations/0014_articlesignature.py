@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0013_careercomparison'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleSignature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=16)),
+                ('simhash', models.BigIntegerField()),
+                ('band_0', models.IntegerField()),
+                ('band_1', models.IntegerField()),
+                ('band_2', models.IntegerField()),
+                ('band_3', models.IntegerField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signatures', to='news.article')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'band_0'], name='signature_band_0_idx'), models.Index(fields=['kind', 'band_1'], name='signature_band_1_idx'), models.Index(fields=['kind', 'band_2'], name='signature_band_2_idx'), models.Index(fields=['kind', 'band_3'], name='signature_band_3_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'kind'), name='unique_article_signature')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:12
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_saved_urls(apps, schema_editor):
+    """Articles stored before this migration count as already seen"""
+    Article = apps.get_model("news", "Article")
+    SeenUrl = apps.get_model("news", "SeenUrl")
+    now = timezone.now()
+    SeenUrl.objects.bulk_create(
+        (
+            SeenUrl(url=url, status="saved", word_count=len(snippet.split()), checked_at=fetched_at or now)
+            for url, snippet, fetched_at in Article.objects.values_list("url", "snippet", "fetched_at").iterator()
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0014_articlesignature'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeenUrl',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=2000, unique=True)),
+                ('status', models.CharField(max_length=16)),
+                ('word_count', models.PositiveIntegerField(default=0)),
+                ('checked_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.RunPython(backfill_saved_urls, migrations.RunPython.noop),
+    ]
@@ -21,6 +21,12 @@ class Article(models.Model):
     fetched_at = models.DateTimeField(auto_now_add=True)
     topics = models.ManyToManyField(Topic,related_name="articles",blank=True)
 
+    class Meta:
+        indexes = [
+            # Home feed keyset order: newest first, id as tie-breaker
+            models.Index(fields=["-published_at", "-id"], name="article_feed_idx"),
+        ]
+
 class SummaryPage(models.Model):
     article = models.OneToOneField(Article, on_delete=models.CASCADE, related_name="summary")
     hero_image = models.URLField(blank=True, default="/static/news/llama-logo.png")
@@ -29,6 +35,86 @@ class SummaryPage(models.Model):
     summarized_at = models.DateTimeField(null=True, blank=True)
     model_version = models.CharField(max_length=64, blank=True)
     confidence = models.FloatField(null=True, blank=True)
+    # Set by summarize_news workers so two workers never summarize the same page
+    claimed_by = models.CharField(max_length=128, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # summarize_news only ever scans pending rows, keep that index small
+            models.Index(
+                fields=["id"],
+                condition=models.Q(summarized_at__isnull=True),
+                name="summary_pending_idx",
+            ),
+        ]
+
+# Tracks what was last sent to Qdrant for an article, so reindexing can skip unchanged rows
+class ArticleIndexState(models.Model):
+    article = models.OneToOneField(Article, on_delete=models.CASCADE, related_name="index_state")
+    content_hash = models.CharField(max_length=64)
+    embedding_model = models.CharField(max_length=64)
+    indexed_at = models.DateTimeField()
+
+# Precomputed Adzuna trending stats (see precompute_trending); also a time series per country
+class TrendingSnapshot(models.Model):
+    country = models.CharField(max_length=8)
+    stats = models.JSONField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["country", "-computed_at"], name="trending_latest_idx"),
+        ]
+
+# Memoized Gemini career comparisons. Names are normalized and stored in sorted
+# order (career_a <= career_b) so "A vs B" and "B vs A" share one row.
+class CareerComparison(models.Model):
+    career_a = models.CharField(max_length=200)
+    career_b = models.CharField(max_length=200)
+    result = models.JSONField()     # comparison with career1 = career_a
+    hit_count = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["career_a", "career_b"], name="unique_career_pair"),
+        ]
+
+# SimHash fingerprints for near-duplicate detection (news/services/simhash.py).
+# The 64-bit hash is also stored as four 16-bit bands: two hashes at most
+# 3 bits apart always share a band, so a lookup is one indexed query per band.
+class ArticleSignature(models.Model):
+    LISTING = "listing"     # GDELT title + snippet, checked before extraction
+    TEXT = "text"           # extracted full text, checked before summarization
+
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name="signatures")
+    kind = models.CharField(max_length=16)
+    simhash = models.BigIntegerField()
+    band_0 = models.IntegerField()
+    band_1 = models.IntegerField()
+    band_2 = models.IntegerField()
+    band_3 = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["article", "kind"], name="unique_article_signature"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", f"band_{i}"], name=f"signature_band_{i}_idx")
+            for i in range(4)
+        ]
+
+# Every URL fetch_news has already processed and what came of it, so later runs
+# skip it before any network I/O (news/services/seen_urls.py keeps a Bloom filter in front)
+class SeenUrl(models.Model):
+    SAVED = "saved"         # stored as an Article
+    REJECTED = "rejected"   # extracted text was too short
+
+    url = models.URLField(max_length=2000, unique=True)
+    status = models.CharField(max_length=16)
+    word_count = models.PositiveIntegerField(default=0)
+    checked_at = models.DateTimeField()
 
 class UserArticleInteraction(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
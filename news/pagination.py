@@ -0,0 +1,93 @@
+import base64
+import json
+
+from django.db.models import F
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+
+
+class PublishedAtCursorPagination(BasePagination):
+    """
+    Keyset pagination over SummaryPage ordered by
+    (article.published_at DESC NULLS LAST, article.id DESC).
+    Each page is a single indexed range query, however deep the cursor is.
+    """
+
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    ordering = (
+        F("article__published_at").desc(nulls_last=True),
+        F("article__id").desc(),
+    )
+
+    def encode_cursor(self, summary):
+        published_at = summary.article.published_at
+        position = {
+            "p": published_at.isoformat() if published_at else None,
+            "i": summary.article_id,
+        }
+        raw = json.dumps(position, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            position = json.loads(base64.urlsafe_b64decode(padded))
+            published_at = parse_datetime(position["p"]) if position["p"] else None
+            if position["p"] and published_at is None:
+                raise ValueError("bad timestamp")
+            return published_at, int(position["i"])
+        except (ValueError, TypeError, KeyError):
+            raise ValidationError({"cursor": "Invalid cursor"})
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def rows_after(self, queryset, published_at, article_id, limit):
+        """
+        Up to `limit` rows that come after the cursor position in feed order.
+        Dated and undated rows are read with two plain range queries instead of
+        one OR, so both can walk article_feed_idx.
+        """
+        if published_at is None:
+            return list(queryset.filter(
+                article__published_at__isnull=True, article__id__lt=article_id
+            )[:limit])
+
+        rows = list(
+            queryset.filter(article__published_at__lte=published_at)
+            .exclude(article__published_at=published_at, article__id__gte=article_id)
+            [:limit]
+        )
+        if len(rows) < limit:
+            # Undated rows sort after every dated one
+            rows += list(queryset.filter(
+                article__published_at__isnull=True
+            )[:limit - len(rows)])
+        return rows
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        # One extra row tells us whether there is a next page
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            rows = self.rows_after(queryset, *self.decode_cursor(cursor), page_size + 1)
+        else:
+            rows = list(queryset[:page_size + 1])
+
+        self.next_cursor = self.encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+        return rows[:page_size]
+
+    def get_paginated_response(self, data):
+        return Response({"results": data, "next_cursor": self.next_cursor})
@@ -12,4 +12,19 @@ class SummaryPageSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = SummaryPage
-        fields = "__all__"
+        # claim columns are summarizer bookkeeping, not content
+        exclude = ["claimed_by", "claimed_at"]
+
+
+# --- Lightweight feed cards (no snippet / ai_summary) ---
+class ArticleCardSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = ["id", "source", "title", "url", "published_at"]
+
+class SummaryCardSerializer(serializers.ModelSerializer):
+    article = ArticleCardSerializer(read_only=True)
+
+    class Meta:
+        model = SummaryPage
+        fields = ["id", "article", "hero_image", "short_preview", "summarized_at", "model_version"]
@@ -1,5 +1,39 @@
 import os
-import requests
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from news.services.http_client import http
+
+# Trending stats cache (per country, per process)
+TRENDING_CACHE_TTL = int(os.getenv("TRENDING_CACHE_TTL_SECONDS", "3600"))
+# After the TTL, stale stats are still served for this long while a refresh runs in the background
+TRENDING_STALE_TTL = int(os.getenv("TRENDING_STALE_TTL_SECONDS", "86400"))
+# Concurrent Adzuna calls during a refresh
+ADZUNA_WORKERS = int(os.getenv("ADZUNA_WORKERS", "8"))
+
+# List of trending/popular job categories to track
+TRENDING_CATEGORIES = [
+    "Python Developer",
+    "Data Scientist", 
+    "React Developer",
+    "Project Manager",
+    "Cyber Security",
+    "DevOps Engineer",
+    "AI Engineer",
+    "Marketing Manager"
+]
+
+# Country codes the Adzuna jobs API serves; anything else is rejected before it
+# can reach (and grow) the caches below
+ADZUNA_COUNTRIES = frozenset({
+    "at", "au", "be", "br", "ca", "ch", "de", "es", "fr", "gb",
+    "in", "it", "mx", "nl", "nz", "pl", "sg", "us", "za",
+})
+
+_trending_cache = {}     # country -> (stats, computed_at)
+_trending_inflight = {}  # country -> Future of the running refresh
+_trending_lock = threading.Lock()
 
 def search_adzuna_jobs(query, location=None, country='in', page=1):
     app_id = os.getenv("ADZUNA_APP_ID")
@@ -22,7 +56,7 @@ def search_adzuna_jobs(query, location=None, country='in', page=1):
         params["where"] = location
         
     try:
-        response = requests.get(base_url, params=params)
+        response = http.get(base_url, params=params)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -46,7 +80,7 @@ def get_adzuna_history(query, country='in', months=12):
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = http.get(url, params=params)
         if response.status_code == 200:
             return response.json().get("month", {})
         return {}
@@ -72,41 +106,86 @@ def calculate_growth(history_data):
     sign = "+" if growth >= 0 else ""
     return f"{sign}{int(growth)}%"
 
-def get_trending_stats(country='in'):
-    # List of trending/popular job categories to track
-    categories = [
-        "Python Developer",
-        "Data Scientist", 
-        "React Developer",
-        "Project Manager",
-        "Cyber Security",
-        "DevOps Engineer",
-        "AI Engineer",
-        "Marketing Manager"
-    ]
-    
-    stats = []
-    
-    for cat in categories:
-        # Fetch current count
-        count = 0
-        try:
-            data = search_adzuna_jobs(query=cat, country=country, page=1)
-            count = data.get("count", 0)
-        except:
-            count = 0
-            
+def _category_count(cat, country):
+    try:
+        data = search_adzuna_jobs(query=cat, country=country, page=1)
+        return data.get("count", 0)
+    except:
+        return 0
+
+
+def compute_trending_stats(country='in', categories=None):
+    """
+    Fetch current count and history for every category from Adzuna.
+    All search + history calls run concurrently.
+    """
+    categories = categories or TRENDING_CATEGORIES
+
+    with ThreadPoolExecutor(max_workers=max(1, ADZUNA_WORKERS)) as pool:
+        counts = {cat: pool.submit(_category_count, cat, country) for cat in categories}
         # Fetch history for growth (Salary Growth as proxy for Demand Trend)
-        history = get_adzuna_history(cat, country=country)
-        growth = calculate_growth(history)
-            
-        stats.append({
-            "title": cat,
-            "count": count,
-            "growth": growth
-        })
-            
+        histories = {cat: pool.submit(get_adzuna_history, cat, country=country) for cat in categories}
+
+        stats = [
+            {
+                "title": cat,
+                "count": counts[cat].result(),
+                "growth": calculate_growth(histories[cat].result()),
+            }
+            for cat in categories
+        ]
+
     # Sort by count descending
     stats.sort(key=lambda x: x['count'], reverse=True)
     
     return stats
+
+
+def _refresh_trending(country):
+    """
+    Recompute stats for a country. Concurrent callers share one in-flight
+    refresh instead of each fanning out to Adzuna. Returns its Future.
+    """
+    with _trending_lock:
+        future = _trending_inflight.get(country)
+        if future is not None:
+            return future
+        future = Future()
+        _trending_inflight[country] = future
+
+    try:
+        stats = compute_trending_stats(country)
+        # All zeros almost always means missing keys or an Adzuna outage: don't cache it
+        if any(s["count"] for s in stats):
+            _trending_cache[country] = (stats, time.monotonic())
+        future.set_result(stats)
+    except Exception as e:
+        future.set_exception(e)
+    finally:
+        with _trending_lock:
+            _trending_inflight.pop(country, None)
+    return future
+
+
+def get_trending_stats(country='in'):
+    """
+    Cached trending stats: fresh entries are returned directly, stale ones are
+    returned immediately while a background refresh runs (stale-while-revalidate).
+    Unknown countries get an empty list without touching Adzuna or the cache.
+    """
+    country = (country or "").lower()
+    if country not in ADZUNA_COUNTRIES:
+        return []
+
+    entry = _trending_cache.get(country)
+    if entry is not None:
+        stats, computed_at = entry
+        age = time.monotonic() - computed_at
+        if age < TRENDING_CACHE_TTL:
+            return stats
+        if age < TRENDING_CACHE_TTL + TRENDING_STALE_TTL:
+            if country not in _trending_inflight:
+                threading.Thread(target=_refresh_trending, args=(country,), daemon=True).start()
+            return stats
+
+    return _refresh_trending(country).result()
@@ -0,0 +1,105 @@
+import os
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from news.models import CareerComparison
+from news.services.gemini import acompare_careers, compare_careers, parse_comparison
+
+# Comparisons older than this are regenerated on the next request
+COMPARISON_CACHE_TTL = timedelta(hours=int(os.getenv("COMPARISON_CACHE_TTL_HOURS", "168")))
+
+
+def normalize_career(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+def comparison_key(career1: str, career2: str):
+    """(career_a, career_b, swapped): the pair in canonical order, and whether the request was reversed"""
+    a, b = normalize_career(career1), normalize_career(career2)
+    if a <= b:
+        return a, b, False
+    return b, a, True
+
+
+def swap_comparison(data: dict) -> dict:
+    """Flip career1/career2 values so a stored (A, B) result answers a (B, A) request"""
+    swapped = dict(data)
+    swapped["comparison"] = [
+        {**row, "career1": row.get("career2"), "career2": row.get("career1")}
+        for row in data.get("comparison", [])
+    ]
+    return swapped
+
+
+def is_fresh(entry) -> bool:
+    return entry.refreshed_at >= timezone.now() - COMPARISON_CACHE_TTL
+
+
+def get_career_comparison(career1: str, career2: str, refresh=False) -> dict:
+    """Comparison for (career1, career2), from the cache unless missing, stale or refresh=True"""
+    a, b, swapped = comparison_key(career1, career2)
+    entry = CareerComparison.objects.filter(career_a=a, career_b=b).first()
+
+    if entry is not None and not refresh and is_fresh(entry):
+        CareerComparison.objects.filter(pk=entry.pk).update(hit_count=F("hit_count") + 1)
+        data = entry.result
+    else:
+        # Always generate in canonical order so the stored result matches (a, b)
+        first, second = (career2, career1) if swapped else (career1, career2)
+        data = parse_comparison(compare_careers(first, second))
+        CareerComparison.objects.update_or_create(
+            career_a=a,
+            career_b=b,
+            defaults={"result": data, "refreshed_at": timezone.now()},
+            create_defaults={"result": data, "refreshed_at": timezone.now(), "hit_count": 1},
+        )
+
+    return swap_comparison(data) if swapped else data
+
+
+async def aget_career_comparison(career1: str, career2: str) -> dict:
+    """Async twin of get_career_comparison for the ASGI view"""
+    a, b, swapped = comparison_key(career1, career2)
+    entry = await CareerComparison.objects.filter(career_a=a, career_b=b).afirst()
+
+    if entry is not None and is_fresh(entry):
+        await CareerComparison.objects.filter(pk=entry.pk).aupdate(hit_count=F("hit_count") + 1)
+        data = entry.result
+    else:
+        first, second = (career2, career1) if swapped else (career1, career2)
+        data = parse_comparison(await acompare_careers(first, second))
+        await CareerComparison.objects.aupdate_or_create(
+            career_a=a,
+            career_b=b,
+            defaults={"result": data, "refreshed_at": timezone.now()},
+            create_defaults={"result": data, "refreshed_at": timezone.now(), "hit_count": 1},
+        )
+
+    return swap_comparison(data) if swapped else data
+
+
+def precompute_popular_comparisons(top=20, pairs=None, force=False):
+    """
+    Refresh the `top` most requested comparisons plus any explicit (career1, career2)
+    pairs, so popular lookups never wait on Gemini. Returns the pairs regenerated.
+    """
+    todo = list(pairs or [])
+    for entry in CareerComparison.objects.order_by("-hit_count")[:top]:
+        todo.append((entry.career_a, entry.career_b))
+
+    refreshed = []
+    seen = set()
+    for career1, career2 in todo:
+        a, b, _ = comparison_key(career1, career2)
+        if (a, b) in seen:
+            continue
+        seen.add((a, b))
+
+        entry = CareerComparison.objects.filter(career_a=a, career_b=b).first()
+        if entry is not None and is_fresh(entry) and not force:
+            continue
+        get_career_comparison(career1, career2, refresh=True)
+        refreshed.append((a, b))
+    return refreshed
@@ -0,0 +1,163 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Project root, next to db.sqlite3
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent.parent / "embedding_cache.sqlite3"
+
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "True") == "True"
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+# ~12KB per 3072-dim vector, so 100k entries is roughly 1.2GB on disk
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "100000"))
+# last_used only drives LRU eviction, so hits refresh it at most this often
+EMBEDDING_CACHE_TOUCH_SECONDS = int(os.getenv("EMBEDDING_CACHE_TOUCH_SECONDS", "300"))
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different copies share a cache entry"""
+    return " ".join(text.split())
+
+
+def cache_key(model: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model}:{digest}"
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding store keyed by (model name, SHA-256 of normalized text).
+    Vectors are stored as float32 blobs in SQLite; the least recently used
+    rows are evicted once the cache grows past `max_entries`.
+    """
+
+    def __init__(self, path=EMBEDDING_CACHE_PATH, max_entries=EMBEDDING_CACHE_MAX_ENTRIES):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+        )
+        self._conn.commit()
+
+    def get(self, model, text):
+        return self.get_many(model, [text]).get(text)
+
+    def get_many(self, model, texts):
+        """Return {text: vector} for every text that is cached"""
+        keys = {}
+        for t in texts:
+            keys.setdefault(cache_key(model, t), []).append(t)
+        found = {}
+
+        with self._lock:
+            rows = []
+            key_list = list(keys)
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(key_list), 500):
+                chunk = key_list[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"SELECT key, vector, last_used FROM embeddings WHERE key IN ({marks})", chunk
+                ).fetchall())
+
+            # Skip the write (and its commit) for rows touched recently
+            now = time.time()
+            stale = [
+                (now, key) for key, _, used in rows
+                if now - used > EMBEDDING_CACHE_TOUCH_SECONDS
+            ]
+            if stale:
+                self._conn.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", stale)
+                self._conn.commit()
+
+            for key, blob, _ in rows:
+                vector = np.frombuffer(blob, dtype=np.float32).tolist()
+                for t in keys[key]:
+                    found[t] = vector
+
+            self.hits += len(rows)
+            self.misses += len(keys) - len(rows)
+        return found
+
+    def put(self, model, text, vector):
+        self.put_many(model, {text: vector})
+
+    def put_many(self, model, vectors):
+        """Store {text: vector}; None vectors are ignored"""
+        now = time.time()
+        rows = [
+            (cache_key(model, text), model, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for text, vector in vectors.items()
+            if vector is not None
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model, vector, last_used) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+            (overflow,),
+        )
+
+    def stats(self):
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache():
+    """Process-wide cache instance, or None when disabled or unavailable"""
+    global _cache
+    if not EMBEDDING_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = EmbeddingCache()
+                except sqlite3.Error as e:
+                    print(f"Embedding cache unavailable: {e}")
+                    return None
+    return _cache
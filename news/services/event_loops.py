@@ -0,0 +1,23 @@
+import asyncio
+import threading
+
+_lock = threading.Lock()
+
+
+def for_running_loop(clients, create):
+    """
+    Return clients[running loop], calling create() the first time a loop asks.
+
+    Async HTTP clients keep pooled connections on the loop that opened them.
+    Without an ASGI server (runserver, gunicorn) asgiref runs each async view
+    in a new loop, so one process-wide client would reuse connections of a
+    closed loop ("Event loop is closed"). Entries for closed loops are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        for old in [l for l in clients if l.is_closed()]:
+            del clients[old]
+        client = clients.get(loop)
+        if client is None:
+            client = clients[loop] = create()
+        return client
@@ -1,21 +1,202 @@
+import json
 import os
+import threading
+import httpx
 from google import genai
 from google.genai.errors import ClientError
 
+from news.services.event_loops import for_running_loop
+
 # Model fallback order (cheap → strong)
 MODEL_PRIORITY = [
     "gemini-2.5-flash-lite",
 ]
 
+# Quota / To many request / rate   → try next model
+RETRY_ERRORS = ("quota", "429", "not found", "limit")
+
+
+_client = None
+_client_key = None
+_client_lock = threading.Lock()
+# Clients for the aio API, one per event loop (see for_running_loop)
+_async_clients = {}
+_async_client_key = None
+
+
 def get_client():
-    return genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    """
+    Shared genai.Client for this process (thread-safe, created on first use).
+    Rebuilt if GEMINI_API_KEY changes or after reset_client().
+    """
+    global _client, _client_key
+    api_key = os.getenv("GEMINI_API_KEY")
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            _client = genai.Client(api_key=api_key)
+            _client_key = api_key
+        return _client
 
-def article_conversation(article_text: str, user_question: str) -> str:
-    client = get_client()
+
+def get_async_client():
+    """genai.Client for client.aio calls, owned by the running event loop"""
+    global _async_client_key
+    api_key = os.getenv("GEMINI_API_KEY")
+    with _client_lock:
+        if _async_client_key != api_key:
+            _async_clients.clear()
+            _async_client_key = api_key
+    return for_running_loop(_async_clients, lambda: genai.Client(api_key=api_key))
+
+
+def reset_client():
+    """Drop the shared clients so the next call reconnects"""
+    global _client
+    with _client_lock:
+        _client = None
+        _async_clients.clear()
+
+
+def require_api_key():
     if not os.getenv("GEMINI_API_KEY"):
         raise RuntimeError("GEMINI_API_KEY is not set in environment variables.")
 
-    prompt = f"""
+
+def _should_try_next_model(model, error, label):
+    """
+    Decide what to do after a model failed: True → try the next model,
+    False → re-raise. Invalid API keys stop immediately with a clear message.
+    """
+    error_msg = str(error).lower()
+    print(f"DEBUG: Model {model}{label} failed with error: {error_msg}")
+
+    # Broken connection pool: reconnect on the next request
+    if isinstance(error, (ConnectionError, httpx.TransportError)):
+        reset_client()
+
+    # If it's an API Key error, we should stop immediately and tell the user
+    if "api_key_invalid" in error_msg or "invalid api key" in error_msg or "401" in error_msg:
+        raise RuntimeError(f"Invalid Gemini API Key. Please check your .env file. Details: {error_msg}")
+
+    if any(keyword in error_msg for keyword in RETRY_ERRORS):
+        print(f"DEBUG: Potentially a quota/limit issue with {model}, trying next...")
+        return True
+
+    # Any other error → stop immediately
+    return False
+
+
+def generate_with_fallback(client, prompt, label=""):
+    """Run the prompt on MODEL_PRIORITY models in order and return the reply text"""
+    last_error = None
+
+    for model in MODEL_PRIORITY:
+        try:
+            print(f"DEBUG: Trying Gemini model: {model}{label}")
+            response = client.models.generate_content(
+                model=model,
+                contents=prompt
+            )
+            return response.text
+
+        except Exception as e:
+            last_error = e
+            if _should_try_next_model(model, e, label):
+                continue
+            raise
+
+    # If all models fail
+    raise RuntimeError("All Gemini models exhausted") from last_error
+
+
+async def agenerate_with_fallback(client, prompt, label=""):
+    """Async twin of generate_with_fallback using the client's aio API"""
+    last_error = None
+
+    for model in MODEL_PRIORITY:
+        try:
+            print(f"DEBUG: Trying Gemini model: {model}{label} (async)")
+            response = await client.aio.models.generate_content(
+                model=model,
+                contents=prompt
+            )
+            return response.text
+
+        except Exception as e:
+            last_error = e
+            if _should_try_next_model(model, e, label):
+                continue
+            raise
+
+    raise RuntimeError("All Gemini models exhausted") from last_error
+
+
+def stream_with_fallback(client, prompt, label=""):
+    """
+    Yield reply text chunks from generate_content_stream.
+    Model fallback only applies until the first chunk arrives; once text has
+    been emitted, errors propagate to the caller.
+    """
+    last_error = None
+
+    for model in MODEL_PRIORITY:
+        try:
+            print(f"DEBUG: Trying Gemini model: {model}{label} (stream)")
+            stream = iter(client.models.generate_content_stream(
+                model=model,
+                contents=prompt
+            ))
+            first = next(stream, None)
+        except Exception as e:
+            last_error = e
+            if _should_try_next_model(model, e, label):
+                continue
+            raise
+
+        if first is not None and first.text:
+            yield first.text
+        for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+        return
+
+    raise RuntimeError("All Gemini models exhausted") from last_error
+
+
+async def astream_with_fallback(client, prompt, label=""):
+    """
+    Async twin of stream_with_fallback (client.aio), for the ASGI streaming
+    endpoints. Same rule: fall back to the next model only before the first chunk.
+    """
+    last_error = None
+
+    for model in MODEL_PRIORITY:
+        try:
+            print(f"DEBUG: Trying Gemini model: {model}{label} (async stream)")
+            stream = await client.aio.models.generate_content_stream(
+                model=model,
+                contents=prompt
+            )
+            first = await anext(stream, None)
+        except Exception as e:
+            last_error = e
+            if _should_try_next_model(model, e, label):
+                continue
+            raise
+
+        if first is not None and first.text:
+            yield first.text
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+        return
+
+    raise RuntimeError("All Gemini models exhausted") from last_error
+
+
+def build_article_prompt(article_text: str, user_question: str) -> str:
+    """Prompt for chatting about one news article"""
+    return f"""
     You are a helpful assistant.
 
     I will give you a news article written in Markdown.
@@ -39,42 +220,40 @@ def article_conversation(article_text: str, user_question: str) -> str:
         Answer in a clear, calm and helpful way.
     """
 
-    last_error = None
 
-    for model in MODEL_PRIORITY:
-        try:
-            print(f"DEBUG: Trying Gemini model: {model}")
-            response = client.models.generate_content(
-                model=model,
-                contents=prompt
-            )
-            return response.text
+def article_conversation(article_text: str, user_question: str) -> str:
+    client = get_client()
+    require_api_key()
+    prompt = build_article_prompt(article_text, user_question)
+    return generate_with_fallback(client, prompt)
 
-        except Exception as e:
-            last_error = e
-            error_msg = str(e).lower()
-            print(f"DEBUG: Model {model} failed with error: {error_msg}")
 
-            # If it's an API Key error, we should stop immediately and tell the user
-            if "api_key_invalid" in error_msg or "invalid api key" in error_msg or "401" in error_msg:
-                 raise RuntimeError(f"Invalid Gemini API Key. Please check your .env file. Details: {error_msg}")
+async def aarticle_conversation(article_text: str, user_question: str) -> str:
+    client = get_async_client()
+    require_api_key()
+    prompt = build_article_prompt(article_text, user_question)
+    return await agenerate_with_fallback(client, prompt)
 
-            # Quota / To many request / rate   → try next model
-            RETRY_ERRORS = ("quota","429","not found", "limit")
 
-            if any(keyword in error_msg for keyword in RETRY_ERRORS):
-                print(f"DEBUG: Potentially a quota/limit issue with {model}, trying next...")
-                continue
+def stream_article_conversation(article_text: str, user_question: str):
+    """Generator of reply chunks for article chat"""
+    client = get_client()
+    require_api_key()
+    prompt = build_article_prompt(article_text, user_question)
+    return stream_with_fallback(client, prompt)
 
-            # Any other error → stop immediately
-            raise
 
-    # If all models fail
-    raise RuntimeError("All Gemini models exhausted") from last_error
+def astream_article_conversation(article_text: str, user_question: str):
+    """Async generator of reply chunks for article chat"""
+    client = get_async_client()
+    require_api_key()
+    prompt = build_article_prompt(article_text, user_question)
+    return astream_with_fallback(client, prompt)
 
-def compare_careers(career1: str, career2: str) -> str:
-    client = get_client()
-    prompt = f"""
+
+def build_comparison_prompt(career1: str, career2: str) -> str:
+    """Prompt asking for a JSON comparison of two careers"""
+    return f"""
     Compare the following two careers: "{career1}" and "{career2}".
     Provide a detailed comparison focusing on:
     - Average Salary
@@ -98,50 +277,69 @@ def compare_careers(career1: str, career2: str) -> str:
     Ensure the output is ONLY the JSON object, NO markdown formatting or extra text.
     """
 
-    last_error = None
-    for model in MODEL_PRIORITY:
-        try:
-            print(f"DEBUG: Trying Gemini model: {model} (comparison)")
-            response = client.models.generate_content(
-                model=model,
-                contents=prompt
-            )
-            return response.text
-        except Exception as e:
-            last_error = e
-            error_msg = str(e).lower()
-            print(f"DEBUG: Model {model} (comparison) failed: {error_msg}")
-            
-            if any(keyword in error_msg for keyword in ("quota", "429", "not found", "limit")):
-                print(f"DEBUG: Potentially a quota/limit issue with {model}, trying next...")
-                continue
-            raise
-    
-    raise RuntimeError("All Gemini models exhausted") from last_error
 
-def general_conversation(user_question: str) -> tuple[str, bool]:
+def compare_careers(career1: str, career2: str) -> str:
     client = get_client()
-    if not os.getenv("GEMINI_API_KEY"):
-        raise RuntimeError("GEMINI_API_KEY is not set in environment variables.")
+    prompt = build_comparison_prompt(career1, career2)
+    return generate_with_fallback(client, prompt, label=" (comparison)")
 
-    context_text = "No specific news context found."
-    used_context = False
-    
-    try:
-        from news.services.qdrant_service import QdrantService
-        qdrant = QdrantService()
-        results = qdrant.search_similar(user_question, limit=3)
-        if results:
-            context_text = "\n\n".join([
-                f"- {r.payload['title']}: {r.payload['snippet']}..." 
-                for r in results
-            ])
-            used_context = True
-    except Exception as e:
-        print(f"DEBUG: Qdrant service unavailable or search failed: {e}")
-        # used_context remains False, context_text remains default
 
-    prompt = f"""
+async def acompare_careers(career1: str, career2: str) -> str:
+    client = get_async_client()
+    prompt = build_comparison_prompt(career1, career2)
+    return await agenerate_with_fallback(client, prompt, label=" (comparison)")
+
+
+def parse_comparison(comparison_text: str) -> dict:
+    """Parse compare_careers output, removing markdown code blocks if Gemini includes them"""
+    clean_json = comparison_text.strip()
+    if clean_json.startswith("```json"):
+        clean_json = clean_json[7:-3].strip()
+    elif clean_json.startswith("```"):
+        clean_json = clean_json[3:-3].strip()
+    return json.loads(clean_json)
+
+
+def build_news_context(articles) -> tuple[str, bool]:
+    """Turn retrieved articles into the RETRIEVED CONTEXT block for general chat"""
+    if not articles:
+        return "No specific news context found.", False
+    context_text = "\n\n".join([
+        f"- {a.title}: {a.snippet[:1000]}..." 
+        for a in articles
+    ])
+    return context_text, True
+
+
+def _in_rank_order(results, articles):
+    by_id = {a.id: a for a in articles}
+    return [by_id[r.id] for r in results if r.id in by_id]
+
+
+def hydrate_news(results):
+    """
+    Load the Articles behind id-only Qdrant hits (point id == Article.id),
+    keeping Qdrant's ranking. One primary-key query instead of shipping
+    payloads over the wire.
+    """
+    if not results:
+        return []
+    from news.models import Article
+    articles = Article.objects.filter(id__in=[r.id for r in results]).only("id", "title", "snippet")
+    return _in_rank_order(results, articles)
+
+
+async def ahydrate_news(results):
+    if not results:
+        return []
+    from news.models import Article
+    qs = Article.objects.filter(id__in=[r.id for r in results]).only("id", "title", "snippet")
+    return _in_rank_order(results, [a async for a in qs])
+
+
+def build_general_prompt(context_text: str, user_question: str) -> str:
+    """Prompt for the job-market assistant with retrieved news context"""
+    return f"""
     You are a professional Job Market & Career Assistant for the "Job Market Trend Hub".
     
     CRITICAL INSTRUCTION:
@@ -165,25 +363,154 @@ def general_conversation(user_question: str) -> tuple[str, bool]:
     Provide a helpful and detailed response to guide the user, incorporating the relevant context provided above if applicable.
     """
 
-    last_error = None
-    for model in MODEL_PRIORITY:
-        try:
-            print(f"DEBUG: Trying Gemini model: {model} (general chat)")
-            response = client.models.generate_content(
-                model=model,
-                contents=prompt
-            )
-            return response.text, used_context
-        except Exception as e:
-            last_error = e
-            error_msg = str(e).lower()
-            print(f"DEBUG: Model {model} (general chat) failed: {error_msg}")
-            
-            if "api_key_invalid" in error_msg or "invalid api key" in error_msg or "401" in error_msg:
-                 raise RuntimeError(f"Invalid Gemini API Key. Details: {error_msg}")
 
-            if any(keyword in error_msg for keyword in ("quota", "429", "not found", "limit")):
-                continue
-            raise
-    
-    raise RuntimeError("All Gemini models exhausted") from last_error
+def retrieve_news(user_question: str):
+    """
+    RAG lookup in Qdrant. Returns (qdrant, question_vector, results);
+    qdrant and the vector are None when Qdrant or embeddings are unavailable.
+    """
+    try:
+        from news.services.qdrant_service import get_qdrant_service
+        qdrant = get_qdrant_service()
+        vector = qdrant.get_embedding(user_question)
+        if vector is None:
+            return qdrant, None, []
+        return qdrant, vector, qdrant.search_by_vector(vector, limit=3, with_payload=False)
+    except Exception as e:
+        print(f"DEBUG: Qdrant service unavailable or search failed: {e}")
+        # no context, the answer falls back to training data
+        return None, None, []
+
+
+def _semantic_cache(qdrant, vector):
+    if qdrant is None or vector is None:
+        return None
+    from news.services.semantic_cache import SemanticCache
+    return SemanticCache(qdrant)
+
+
+def general_conversation(user_question: str) -> tuple[str, bool]:
+    client = get_client()
+    require_api_key()
+
+    qdrant, vector, results = retrieve_news(user_question)
+    context_text, used_context = build_news_context(hydrate_news(results))
+    context_ids = [r.id for r in results]
+
+    # Near-identical question with the same retrieved news → reuse the answer
+    cache = _semantic_cache(qdrant, vector)
+    if cache:
+        cached = cache.lookup(vector, context_ids)
+        if cached is not None:
+            return cached, used_context
+
+    prompt = build_general_prompt(context_text, user_question)
+    reply = generate_with_fallback(client, prompt, label=" (general chat)")
+
+    if cache:
+        cache.store(vector, user_question, context_ids, reply)
+    return reply, used_context
+
+
+def stream_general_conversation(user_question: str):
+    """
+    Retrieval runs up front; returns (generator of reply chunks, used_context).
+    """
+    client = get_client()
+    require_api_key()
+
+    qdrant, vector, results = retrieve_news(user_question)
+    context_text, used_context = build_news_context(hydrate_news(results))
+    context_ids = [r.id for r in results]
+
+    cache = _semantic_cache(qdrant, vector)
+    if cache:
+        cached = cache.lookup(vector, context_ids)
+        if cached is not None:
+            return iter([cached]), used_context
+
+    prompt = build_general_prompt(context_text, user_question)
+    chunks = stream_with_fallback(client, prompt, label=" (general chat)")
+    if not cache:
+        return chunks, used_context
+
+    def store_when_done():
+        parts = []
+        for text in chunks:
+            parts.append(text)
+            yield text
+        cache.store(vector, user_question, context_ids, "".join(parts))
+
+    return store_when_done(), used_context
+
+
+async def aretrieve_news(user_question: str):
+    """Async twin of retrieve_news: (qdrant, question_vector, results)"""
+    try:
+        from news.services.qdrant_service import get_qdrant_service
+        qdrant = get_qdrant_service()
+        vector = await qdrant.aget_embedding(user_question)
+        if vector is None:
+            return qdrant, None, []
+        results = await qdrant.asearch_by_vector(vector, limit=3, with_payload=False)
+        return qdrant, vector, results
+    except Exception as e:
+        print(f"DEBUG: Qdrant service unavailable or search failed: {e}")
+        return None, None, []
+
+
+async def ageneral_conversation(user_question: str) -> tuple[str, bool]:
+    client = get_async_client()
+    require_api_key()
+
+    qdrant, vector, results = await aretrieve_news(user_question)
+    context_text, used_context = build_news_context(await ahydrate_news(results))
+    context_ids = [r.id for r in results]
+
+    cache = _semantic_cache(qdrant, vector)
+    if cache:
+        cached = await cache.alookup(vector, context_ids)
+        if cached is not None:
+            return cached, used_context
+
+    prompt = build_general_prompt(context_text, user_question)
+    reply = await agenerate_with_fallback(client, prompt, label=" (general chat)")
+
+    if cache:
+        await cache.astore(vector, user_question, context_ids, reply)
+    return reply, used_context
+
+
+async def astream_general_conversation(user_question: str):
+    """
+    Async twin of stream_general_conversation:
+    returns (async generator of reply chunks, used_context).
+    """
+    client = get_async_client()
+    require_api_key()
+
+    qdrant, vector, results = await aretrieve_news(user_question)
+    context_text, used_context = build_news_context(await ahydrate_news(results))
+    context_ids = [r.id for r in results]
+
+    cache = _semantic_cache(qdrant, vector)
+    if cache:
+        cached = await cache.alookup(vector, context_ids)
+        if cached is not None:
+            async def replay():
+                yield cached
+            return replay(), used_context
+
+    prompt = build_general_prompt(context_text, user_question)
+    chunks = astream_with_fallback(client, prompt, label=" (general chat)")
+    if not cache:
+        return chunks, used_context
+
+    async def store_when_done():
+        parts = []
+        async for text in chunks:
+            parts.append(text)
+            yield text
+        await cache.astore(vector, user_question, context_ids, "".join(parts))
+
+    return store_when_done(), used_context
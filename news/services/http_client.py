@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+# Keep-alive connections kept per host
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "16"))
+# Article extraction touches many one-off hosts, so only keep this many pools around
+HTTP_MAX_HOSTS = int(os.getenv("HTTP_MAX_HOSTS", "64"))
+# Retries for idempotent requests (GET/HEAD) on connection errors and 429/5xx
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF_SECONDS", "1"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _retry_after(response):
+    """Seconds from a Retry-After header (delta or HTTP date), if present"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpClient:
+    """
+    Shared HTTP layer for upstream APIs (Adzuna, GDELT, Ollama, article pages).
+    One keep-alive session per host, default connect/read timeouts, retry with
+    exponential backoff for idempotent calls, and per-host latency/error metrics.
+    """
+
+    def __init__(self, pool_size=HTTP_POOL_SIZE, max_hosts=HTTP_MAX_HOSTS):
+        self.pool_size = pool_size
+        self.max_hosts = max_hosts
+        self._sessions = OrderedDict()
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _session(self, host):
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is not None:
+                self._sessions.move_to_end(host)
+                return session
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._sessions[host] = session
+
+            # Drop the least recently used pool
+            while len(self._sessions) > self.max_hosts:
+                _, old = self._sessions.popitem(last=False)
+                old.close()
+            return session
+
+    def _record(self, host, elapsed, error):
+        with self._lock:
+            m = self._metrics.setdefault(
+                host, {"requests": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            m["requests"] += 1
+            m["errors"] += int(error)
+            m["total_seconds"] += elapsed
+            m["max_seconds"] = max(m["max_seconds"], elapsed)
+
+    def request(self, method, url, timeout=None, retries=None, **kwargs):
+        """
+        Like requests.request. `timeout` may be a (connect, read) tuple or a read
+        timeout in seconds. `retries` defaults to HTTP_RETRIES for idempotent
+        methods and 0 otherwise; pass 0 when the caller has its own retry policy.
+        """
+        method = method.upper()
+        host = urlparse(url).netloc.lower()
+
+        if timeout is None:
+            timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        elif not isinstance(timeout, tuple):
+            timeout = (HTTP_CONNECT_TIMEOUT, timeout)
+
+        if retries is None:
+            retries = HTTP_RETRIES if method in IDEMPOTENT_METHODS else 0
+
+        session = self._session(host)
+        attempt = 0
+        while True:
+            t0 = time.monotonic()
+            try:
+                response = session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._record(host, time.monotonic() - t0, error=True)
+                if attempt >= retries:
+                    raise
+                delay = HTTP_BACKOFF * (2 ** attempt)
+            else:
+                self._record(host, time.monotonic() - t0, error=response.status_code >= 400)
+                if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                    return response
+                delay = _retry_after(response)
+                if delay is None:
+                    delay = HTTP_BACKOFF * (2 ** attempt)
+                response.close()
+
+            attempt += 1
+            time.sleep(delay)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def metrics(self):
+        """Per-host counters with average latency in milliseconds"""
+        with self._lock:
+            return {
+                host: {
+                    "requests": m["requests"],
+                    "errors": m["errors"],
+                    "avg_ms": round(m["total_seconds"] / m["requests"] * 1000, 1),
+                    "max_ms": round(m["max_seconds"] * 1000, 1),
+                }
+                for host, m in self._metrics.items()
+            }
+
+    def format_metrics(self, hosts=None):
+        """Short per-host report for management command output"""
+        lines = []
+        for host, m in sorted(self.metrics().items()):
+            if hosts and host not in hosts:
+                continue
+            lines.append(
+                f"  {host}: {m['requests']} requests, {m['errors']} errors, "
+                f"avg {m['avg_ms']} ms, max {m['max_ms']} ms"
+            )
+        return "\n".join(lines)
+
+
+# Process-wide client
+http = HttpClient()
@@ -0,0 +1,62 @@
+import hashlib
+
+from django.utils import timezone
+
+from news.models import ArticleIndexState
+from news.services.qdrant_service import EMBEDDING_MODEL
+
+
+def article_content_hash(article) -> str:
+    """Hash of everything we send to Qdrant for an article (vector text + payload)"""
+    parts = [
+        article.title or "",
+        article.url or "",
+        article.source or "",
+        str(article.published_at or ""),
+        article.snippet or "",
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def needs_indexing(article, state=None) -> bool:
+    """
+    True if the article was never indexed, or was indexed with a different
+    embedding model or different content.
+    """
+    if state is None:
+        return True
+    return (
+        state.embedding_model != EMBEDDING_MODEL
+        or state.content_hash != article_content_hash(article)
+    )
+
+
+def pending_for_index(articles):
+    """Filter Article instances down to the ones that are new or changed"""
+    articles = list(articles)
+    states = ArticleIndexState.objects.in_bulk(
+        [a.id for a in articles], field_name="article_id"
+    )
+    return [a for a in articles if needs_indexing(a, states.get(a.id))]
+
+
+def mark_indexed(articles):
+    """Record the current content hash for articles that were upserted into Qdrant"""
+    now = timezone.now()
+    states = [
+        ArticleIndexState(
+            article_id=a.id,
+            content_hash=article_content_hash(a),
+            embedding_model=EMBEDDING_MODEL,
+            indexed_at=now,
+        )
+        for a in articles
+    ]
+    if not states:
+        return
+    ArticleIndexState.objects.bulk_create(
+        states,
+        update_conflicts=True,
+        unique_fields=["article"],
+        update_fields=["content_hash", "embedding_model", "indexed_at"],
+    )
@@ -0,0 +1,94 @@
+import os
+from collections import deque
+
+# Keywords (Job Market Focus)
+ECON_KEYWORDS = os.getenv(
+    "ECON_KEYWORDS",
+    "mass layoffs, layoffs, job cuts, workforce reduction, staff reduction, downsizing, restructuring, employee termination, hiring surge, mass hiring, recruitment drive, job openings, hiring freeze, talent acquisition, expanding workforce, unemployment, rising unemployment, labor shortage, talent shortage, job market slowdown, tech layoffs, manufacturing layoffs, corporate layoffs, hiring boom"
+)
+ECON_KEYWORDS = [k.strip() for k in ECON_KEYWORDS.split(",") if k.strip()]
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """
+    Aho–Corasick automaton over a keyword list. One pass over the text finds
+    every keyword occurrence (overlapping ones too, e.g. "layoffs" inside
+    "tech layoffs"), so the cost depends on the text length, not on how many
+    keywords there are. Matching is case-insensitive and on whole words.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            node = 0
+            for ch in keyword.lower():
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            if keyword:
+                self._out[node].append(index)
+
+        # Breadth-first so every fail link points at an already finished node
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def finditer(self, text):
+        """
+        Yield (keyword, start, end) for every whole-word occurrence.
+        Offsets index text.lower(), which matches text for all but a few
+        non-ASCII characters.
+        """
+        if not text:
+            return
+        lowered = text.lower()
+        node = 0
+        for i, ch in enumerate(lowered):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+
+            for index in self._out[node]:
+                keyword = self.keywords[index]
+                end = i + 1
+                start = end - len(keyword)
+                if start > 0 and _is_word_char(lowered[start - 1]):
+                    continue
+                if end < len(lowered) and _is_word_char(lowered[end]):
+                    continue
+                yield keyword, start, end
+
+    def find_all(self, text):
+        return list(self.finditer(text))
+
+    def matched(self, text):
+        """Distinct keywords found in text, in keyword-list order"""
+        found = {keyword for keyword, _, _ in self.finditer(text)}
+        return [k for k in self.keywords if k in found]
+
+    def contains_any(self, text):
+        return next(self.finditer(text), None) is not None
+
+
+# Built once at import and shared by ranking and topic assignment
+keyword_matcher = KeywordMatcher(ECON_KEYWORDS)
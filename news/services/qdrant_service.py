@@ -1,20 +1,159 @@
+import asyncio
 import os
+import threading
 import time
-from qdrant_client import QdrantClient
+from asgiref.sync import sync_to_async
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.http import models
-from google import genai
 import numpy as np
 
+from news.services.embedding_cache import get_embedding_cache
+from news.services.event_loops import for_running_loop
+from news.services.gemini import get_async_client, get_client
+
+EMBEDDING_MODEL = "gemini-embedding-001"
+# Gemini accepts up to 100 texts per embed_content call
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "100"))
+UPSERT_BATCH_SIZE = int(os.getenv("QDRANT_UPSERT_BATCH_SIZE", "256"))
+# How often the shared service pings Qdrant before handing itself out
+QDRANT_HEALTH_INTERVAL = int(os.getenv("QDRANT_HEALTH_INTERVAL_SECONDS", "30"))
+
+QDRANT_HOST = os.getenv("QDRANT_HOST", "localhost")
+QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+# gRPC has lower per-call overhead and smaller messages than REST+JSON
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "False") == "True"
+
+# Storage layout for job_market_news. A float32 3072-dim vector is ~12KB;
+# scalar (int8) quantization keeps a 4x smaller copy in RAM, binary 32x.
+# These apply when the collection is created; for an existing one run
+# `manage.py index_raw_news --apply-config` after changing them.
+QDRANT_QUANTIZATION = os.getenv("QDRANT_QUANTIZATION", "none").lower()  # none | scalar | binary
+QDRANT_QUANTIZATION_ALWAYS_RAM = os.getenv("QDRANT_QUANTIZATION_ALWAYS_RAM", "True") == "True"
+# Keep the original vectors on disk (memmap); only used to rescore candidates
+QDRANT_VECTORS_ON_DISK = os.getenv("QDRANT_VECTORS_ON_DISK", "False") == "True"
+QDRANT_HNSW_M = int(os.getenv("QDRANT_HNSW_M", "16"))
+QDRANT_HNSW_EF_CONSTRUCT = int(os.getenv("QDRANT_HNSW_EF_CONSTRUCT", "100"))
+QDRANT_HNSW_ON_DISK = os.getenv("QDRANT_HNSW_ON_DISK", "False") == "True"
+# Search-time knobs; QDRANT_SEARCH_EF=0 leaves Qdrant's default
+QDRANT_SEARCH_EF = int(os.getenv("QDRANT_SEARCH_EF", "0"))
+QDRANT_RESCORE = os.getenv("QDRANT_RESCORE", "True") == "True"
+QDRANT_OVERSAMPLING = float(os.getenv("QDRANT_OVERSAMPLING", "2.0"))
+
+
+def quantization_config(kind=QDRANT_QUANTIZATION):
+    if kind == "scalar":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=QDRANT_QUANTIZATION_ALWAYS_RAM,
+            )
+        )
+    if kind == "binary":
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=QDRANT_QUANTIZATION_ALWAYS_RAM)
+        )
+    if kind in ("", "none"):
+        return None
+    raise ValueError(f"Unknown QDRANT_QUANTIZATION: {kind}")
+
+
+def hnsw_config():
+    return models.HnswConfigDiff(
+        m=QDRANT_HNSW_M,
+        ef_construct=QDRANT_HNSW_EF_CONSTRUCT,
+        on_disk=QDRANT_HNSW_ON_DISK,
+    )
+
+
+def search_params(kind=QDRANT_QUANTIZATION, rescore=QDRANT_RESCORE, oversampling=QDRANT_OVERSAMPLING):
+    """Query-time params matching the collection's quantization, or None for defaults"""
+    quantization = None
+    if kind not in ("", "none"):
+        quantization = models.QuantizationSearchParams(
+            rescore=rescore,
+            oversampling=oversampling if rescore else None,
+        )
+    if quantization is None and not QDRANT_SEARCH_EF:
+        return None
+    return models.SearchParams(hnsw_ef=QDRANT_SEARCH_EF or None, quantization=quantization)
+
+
+def batched(items, size):
+    """Yield lists of up to `size` items from any iterable"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class QdrantService:
-    def __init__(self):
-        self.host = "localhost"
-        self.port = 6333
-        self.client = QdrantClient(host=self.host, port=self.port)
+    def __init__(self, prefer_grpc=QDRANT_PREFER_GRPC):
+        self.host = QDRANT_HOST
+        self.port = QDRANT_PORT
+        self.grpc_port = QDRANT_GRPC_PORT
+        self.prefer_grpc = prefer_grpc
+        self.client = QdrantClient(**self._connection_args())
         self.collection_name = "job_market_news"
         self.vector_size = 3072  # gemini-embedding-001 size
-        self.gemini_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+        self.quantization = QDRANT_QUANTIZATION
+        self.embedding_cache = get_embedding_cache()
+        self._async_clients = {}
+
+    def _connection_args(self):
+        return {
+            "host": self.host,
+            "port": self.port,
+            "grpc_port": self.grpc_port,
+            "prefer_grpc": self.prefer_grpc,
+        }
+
+    @property
+    def gemini_client(self):
+        # Looked up each time so a reset_client() after a transport error is picked up
+        return get_client()
+
+    def healthy(self):
+        try:
+            self.client.get_collections()
+            return True
+        except Exception:
+            return False
+
+    def reconnect(self):
+        """Replace the Qdrant clients (e.g. after Qdrant restarted)"""
+        old = self.client
+        self.client = QdrantClient(**self._connection_args())
+        # Async clients are recreated lazily, per event loop
+        self._async_clients = {}
+        try:
+            old.close()
+        except Exception:
+            pass
+
+    @property
+    def async_client(self):
+        """AsyncQdrantClient for the async code path, one per event loop"""
+        return for_running_loop(
+            self._async_clients, lambda: AsyncQdrantClient(**self._connection_args())
+        )
+
+    async def aclose(self):
+        """Close the running loop's async client"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
 
     def ensure_collection(self):
+        """
+        Create the collection if it is missing or has the wrong dimension.
+        Returns True when a new (empty) collection was created.
+        """
         try:
             collection_info = self.client.get_collection(collection_name=self.collection_name)
             current_dim = collection_info.config.params.vectors.size
@@ -22,30 +161,50 @@ class QdrantService:
                 print(f"Dimension mismatch (expected {self.vector_size}, got {current_dim}). Recreating collection...")
                 self.client.delete_collection(collection_name=self.collection_name)
                 raise Exception("Trigger recreation")
+            return False
         except Exception:
             print(f"Creating collection: {self.collection_name}")
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=models.VectorParams(
-                    size=self.vector_size,
-                    distance=models.Distance.COSINE
-                )
-            )
+            self.create_collection(self.collection_name)
+            return True
 
-    def get_embedding(self, text):
-        if not text:
-            return None
-        
-        # Limit text length as embeddings models have limits
-        text = text[:8000] 
-        
+    def create_collection(self, collection_name, quantization=None):
+        """Create a collection with the configured vector storage, HNSW and quantization"""
+        quantization = self.quantization if quantization is None else quantization
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=models.VectorParams(
+                size=self.vector_size,
+                distance=models.Distance.COSINE,
+                on_disk=QDRANT_VECTORS_ON_DISK,
+            ),
+            hnsw_config=hnsw_config(),
+            quantization_config=quantization_config(quantization),
+        )
+
+    def apply_collection_config(self):
+        """
+        Bring an existing collection in line with the current settings;
+        Qdrant rebuilds the quantized copy and index in the background.
+        """
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            vectors_config={"": models.VectorParamsDiff(on_disk=QDRANT_VECTORS_ON_DISK)},
+            hnsw_config=hnsw_config(),
+            quantization_config=quantization_config(self.quantization) or models.Disabled.DISABLED,
+        )
+
+    def _embed(self, contents):
+        """
+        One embed_content call for a list of texts, with rate-limit retries.
+        Returns a list of vectors aligned with contents, or None on failure.
+        """
         for attempt in range(3):
             try:
                 result = self.gemini_client.models.embed_content(
-                    model="gemini-embedding-001",
-                    contents=text
+                    model=EMBEDDING_MODEL,
+                    contents=contents
                 )
-                return result.embeddings[0].values
+                return [e.values for e in result.embeddings]
             except Exception as e:
                 error_msg = str(e).lower()
                 if "quota" in error_msg or "429" in error_msg:
@@ -56,40 +215,204 @@ class QdrantService:
                 return None
         return None
 
+    def get_embedding(self, text):
+        if not text:
+            return None
+        
+        # Limit text length as embeddings models have limits
+        text = text[:8000] 
+
+        if self.embedding_cache:
+            cached = self.embedding_cache.get(EMBEDDING_MODEL, text)
+            if cached is not None:
+                return cached
+
+        vectors = self._embed(text)
+        if not vectors:
+            return None
+
+        if self.embedding_cache:
+            self.embedding_cache.put(EMBEDDING_MODEL, text, vectors[0])
+        return vectors[0]
+
+    def get_embeddings(self, texts):
+        """
+        Embed many texts, EMBED_BATCH_SIZE per Gemini request.
+        Returns a list aligned with texts; entries are None for empty
+        texts or failed batches.
+        """
+        vectors = [None] * len(texts)
+        todo = [(i, t[:8000]) for i, t in enumerate(texts) if t]
+
+        # Unchanged texts are served from the on-disk cache
+        if self.embedding_cache and todo:
+            cached = self.embedding_cache.get_many(EMBEDDING_MODEL, [t for _, t in todo])
+            for i, t in todo:
+                vectors[i] = cached.get(t)
+            todo = [(i, t) for i, t in todo if vectors[i] is None]
+
+        for batch in batched(todo, EMBED_BATCH_SIZE):
+            result = self._embed([t for _, t in batch])
+            if not result:
+                continue
+            for (i, _), vector in zip(batch, result):
+                vectors[i] = vector
+            if self.embedding_cache:
+                self.embedding_cache.put_many(
+                    EMBEDDING_MODEL, {t: vectors[i] for i, t in batch}
+                )
+        return vectors
+
+    @staticmethod
+    def _point(article, vector):
+        return models.PointStruct(
+            id=article.id,
+            vector=vector,
+            payload={
+                "title": article.title,
+                "url": article.url,
+                "source": article.source,
+                "published_at": str(article.published_at) if article.published_at else "",
+                "snippet": article.snippet[:1000] # store preview
+            }
+        )
+
     def upsert_article(self, article):
         """
         article: Article model instance
         """
-        embedding = self.get_embedding(article.snippet)
-        if embedding is None:
-            return False
+        return bool(self.upsert_articles([article]))
 
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=[
-                models.PointStruct(
-                    id=article.id,
-                    vector=embedding,
-                    payload={
-                        "title": article.title,
-                        "url": article.url,
-                        "source": article.source,
-                        "published_at": str(article.published_at) if article.published_at else "",
-                        "snippet": article.snippet[:1000] # store preview
-                    }
-                )
+    def upsert_articles(self, articles, batch_size=UPSERT_BATCH_SIZE, wait=True):
+        """
+        Embed and upsert Article instances in batches.
+        With wait=False Qdrant acknowledges each batch before it is applied.
+        Returns the ids of the articles that were sent to Qdrant.
+        """
+        indexed = []
+        for batch in batched(articles, batch_size):
+            vectors = self.get_embeddings([a.snippet for a in batch])
+            points = [
+                self._point(article, vector)
+                for article, vector in zip(batch, vectors)
+                if vector is not None
             ]
-        )
-        return True
+            if not points:
+                continue
+
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=points,
+                wait=wait,
+            )
+            indexed.extend(p.id for p in points)
+        return indexed
 
-    def search_similar(self, query_text, limit=5):
+    def search_similar(self, query_text, limit=5, with_payload=True):
         embedding = self.get_embedding(query_text)
         if embedding is None:
             return []
+        return self.search_by_vector(embedding, limit=limit, with_payload=with_payload)
 
+    def search_by_vector(self, embedding, limit=5, with_payload=True):
+        """
+        `with_payload` is True (full payload), a list of payload fields to
+        return, or False for ids and scores only when the caller loads the
+        articles from the database itself.
+        """
         results = self.client.query_points(
             collection_name=self.collection_name,
             query=embedding,
-            limit=limit
+            limit=limit,
+            with_payload=with_payload,
+            with_vectors=False,
+            search_params=search_params(self.quantization),
         ).points
         return results
+
+    async def aget_embedding(self, text):
+        """Async twin of get_embedding, using the Gemini client's aio API"""
+        if not text:
+            return None
+
+        text = text[:8000]
+
+        # The SQLite cache blocks (and may write), so keep it off the event loop
+        if self.embedding_cache:
+            cached = await sync_to_async(self.embedding_cache.get, thread_sensitive=False)(
+                EMBEDDING_MODEL, text
+            )
+            if cached is not None:
+                return cached
+
+        for attempt in range(3):
+            try:
+                result = await get_async_client().aio.models.embed_content(
+                    model=EMBEDDING_MODEL,
+                    contents=text
+                )
+                vector = result.embeddings[0].values
+                if self.embedding_cache:
+                    await sync_to_async(self.embedding_cache.put, thread_sensitive=False)(
+                        EMBEDDING_MODEL, text, vector
+                    )
+                return vector
+            except Exception as e:
+                error_msg = str(e).lower()
+                if "quota" in error_msg or "429" in error_msg:
+                    print(f"Rate limit hit, waiting... (attempt {attempt+1})")
+                    await asyncio.sleep(2 * (attempt + 1))
+                    continue
+                print(f"Error generating embedding: {e}")
+                return None
+        return None
+
+    async def asearch_similar(self, query_text, limit=5, with_payload=True):
+        embedding = await self.aget_embedding(query_text)
+        if embedding is None:
+            return []
+        return await self.asearch_by_vector(embedding, limit=limit, with_payload=with_payload)
+
+    async def asearch_by_vector(self, embedding, limit=5, with_payload=True):
+        results = await self.async_client.query_points(
+            collection_name=self.collection_name,
+            query=embedding,
+            limit=limit,
+            with_payload=with_payload,
+            with_vectors=False,
+            search_params=search_params(self.quantization),
+        )
+        return results.points
+
+
+_service = None
+_service_lock = threading.Lock()
+_last_health_check = 0.0
+
+
+def _check_health(service):
+    if not service.healthy():
+        print("Qdrant health check failed, reconnecting...")
+        service.reconnect()
+
+
+def get_qdrant_service():
+    """
+    Process-wide QdrantService, created on first use. Every
+    QDRANT_HEALTH_INTERVAL seconds it is health-checked and reconnected if
+    Qdrant stopped answering, instead of building new clients per request.
+    The check runs in a background thread, so neither the caller (possibly
+    on the ASGI event loop) nor other threads wait on the network for it.
+    """
+    global _service, _last_health_check
+    with _service_lock:
+        now = time.monotonic()
+        if _service is None:
+            _service = QdrantService()
+            _last_health_check = now
+        elif now - _last_health_check > QDRANT_HEALTH_INTERVAL:
+            _last_health_check = now
+            threading.Thread(
+                target=_check_health, args=(_service,), name="qdrant-health", daemon=True
+            ).start()
+        return _service
@@ -0,0 +1,167 @@
+import hashlib
+import math
+import os
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from news.models import SeenUrl
+
+# Bloom filter sizing: ~1.2MB for a million URLs at 1% false positives
+SEEN_URL_CAPACITY = int(os.getenv("SEEN_URL_CAPACITY", "1000000"))
+SEEN_URL_ERROR_RATE = float(os.getenv("SEEN_URL_ERROR_RATE", "0.01"))
+# Rejected (too short) URLs are tried again after this many days; saved ones never are
+SEEN_URL_RETRY_REJECTED_DAYS = int(os.getenv("SEEN_URL_RETRY_REJECTED_DAYS", "7"))
+# How often a long run picks up rows written by other processes
+SEEN_URL_SYNC_SECONDS = int(os.getenv("SEEN_URL_SYNC_SECONDS", "30"))
+
+BLOOM_CACHE_KEY = "seen_urls:bloom"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings. "Not in the filter" is always
+    right; "maybe in the filter" has to be confirmed against the database.
+    """
+
+    def __init__(self, capacity, error_rate, bits=None, count=0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    def _positions(self, key):
+        # Kirsch–Mitzenmacher: k positions from two 64-bit hashes
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & 1 << (pos & 7) for pos in self._positions(key))
+
+    def full(self):
+        return self.count >= self.capacity
+
+
+class SeenUrls:
+    """
+    URLs fetch_news has processed before. The Bloom filter answers most
+    lookups for new URLs without touching SQLite; only "maybe seen" URLs
+    are confirmed with one indexed query. The filter is kept in the Django
+    cache between runs and rebuilt from SeenUrl when missing or full.
+
+    `synced_id` is the highest SeenUrl id up to which every row is in the
+    filter. Rows written later (a crashed run whose filter was never saved,
+    another process running at the same time) have higher ids, so sync()
+    adds them before the filter is trusted to say "not seen".
+    """
+
+    def __init__(self, bloom, synced_id=0):
+        self.bloom = bloom
+        self.synced_id = synced_id
+        self.synced_at = 0.0
+        self.stats = {"bloom_negative": 0, "db_checks": 0, "false_positives": 0}
+
+    @classmethod
+    def load(cls, capacity=SEEN_URL_CAPACITY, error_rate=SEEN_URL_ERROR_RATE):
+        state = cache.get(BLOOM_CACHE_KEY)
+        if state and state["capacity"] >= capacity and state["error_rate"] == error_rate:
+            bloom = BloomFilter(state["capacity"], error_rate, bytearray(state["bits"]), state["count"])
+            if not bloom.full():
+                seen = cls(bloom, state.get("synced_id", 0))
+                if seen.sync():
+                    seen.save()
+                return seen
+        return cls.rebuild(capacity, error_rate)
+
+    @classmethod
+    def rebuild(cls, capacity=SEEN_URL_CAPACITY, error_rate=SEEN_URL_ERROR_RATE):
+        total = SeenUrl.objects.count()
+        # Leave room to grow so the filter isn't rebuilt every run
+        while capacity < total * 2:
+            capacity *= 2
+        seen = cls(BloomFilter(capacity, error_rate))
+        seen.sync()
+        seen.save()
+        return seen
+
+    def sync(self):
+        """Add SeenUrl rows newer than synced_id; returns how many were added"""
+        added = 0
+        rows = (
+            SeenUrl.objects.filter(id__gt=self.synced_id)
+            .order_by("id")
+            .values_list("id", "url")
+            .iterator(chunk_size=5000)
+        )
+        for row_id, url in rows:
+            self.bloom.add(url)
+            self.synced_id = row_id
+            added += 1
+        self.synced_at = time.monotonic()
+        return added
+
+    def save(self):
+        cache.set(BLOOM_CACHE_KEY, {
+            "capacity": self.bloom.capacity,
+            "error_rate": self.bloom.error_rate,
+            "count": self.bloom.count,
+            "synced_id": self.synced_id,
+            "bits": bytes(self.bloom.bits),
+        }, None)
+
+    def lookup(self, url):
+        """The SeenUrl row for url, or None if it was never processed"""
+        if time.monotonic() - self.synced_at > SEEN_URL_SYNC_SECONDS:
+            self.sync()
+        if url not in self.bloom:
+            self.stats["bloom_negative"] += 1
+            return None
+        self.stats["db_checks"] += 1
+        row = SeenUrl.objects.filter(url=url).first()
+        if row is None:
+            self.stats["false_positives"] += 1
+        return row
+
+    def should_skip(self, url):
+        """Skip URLs already saved, and rejected ones until they are due for a retry"""
+        row = self.lookup(url)
+        if row is None:
+            return None
+        if row.status == SeenUrl.SAVED:
+            return row
+        retry_after = row.checked_at + timedelta(days=SEEN_URL_RETRY_REJECTED_DAYS)
+        if row.status == SeenUrl.REJECTED and timezone.now() < retry_after:
+            return row
+        return None
+
+    def record(self, status, word_counts):
+        """Store the outcome for {url: word_count} and add the URLs to the filter"""
+        if not word_counts:
+            return
+        now = timezone.now()
+        SeenUrl.objects.bulk_create(
+            [
+                SeenUrl(url=url, status=status, word_count=words, checked_at=now)
+                for url, words in word_counts.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["url"],
+            update_fields=["status", "word_count", "checked_at"],
+        )
+        for url in word_counts:
+            self.bloom.add(url)
+        # Persist once the rows are committed; synced_id is not advanced here,
+        # so a filter saved by an overlapping run still catches up on load
+        transaction.on_commit(self.save)
@@ -0,0 +1,221 @@
+import os
+import threading
+import time
+import uuid
+
+from qdrant_client.http import models
+
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "True") == "True"
+SEMANTIC_CACHE_COLLECTION = os.getenv("SEMANTIC_CACHE_COLLECTION", "general_chat_cache")
+# Cosine similarity a new question needs with a cached one to reuse its answer
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+# Cached answers older than this are ignored, so advice follows the news
+SEMANTIC_CACHE_TTL = int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "86400"))
+# Expired answers are deleted from the collection at most this often (per process)
+SEMANTIC_CACHE_PURGE_INTERVAL = int(os.getenv("SEMANTIC_CACHE_PURGE_INTERVAL_SECONDS", "3600"))
+
+# Process-wide hit/miss counters (a SemanticCache is created per request)
+_stats = {"hits": 0, "misses": 0, "stores": 0, "purges": 0, "errors": 0}
+_stats_lock = threading.Lock()
+_collection_ready = False
+_async_collection_ready = False
+_last_purge = 0.0
+
+
+def _count(key):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def semantic_cache_stats():
+    with _stats_lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+class SemanticCache:
+    """
+    Answer cache for general chat, stored in its own Qdrant collection.
+    A cached answer is reused when a new question's embedding is within
+    SEMANTIC_CACHE_THRESHOLD of a cached question AND the same news articles
+    were retrieved as context, so answers change when the news does.
+    """
+
+    def __init__(self, qdrant):
+        self.qdrant = qdrant
+        self.client = qdrant.client
+        self.collection_name = SEMANTIC_CACHE_COLLECTION
+
+    def _create_collection(self):
+        print(f"Creating collection: {self.collection_name}")
+        return dict(
+            collection_name=self.collection_name,
+            vectors_config=models.VectorParams(
+                size=self.qdrant.vector_size,
+                distance=models.Distance.COSINE
+            )
+        )
+
+    def _created_at_index(self):
+        # Range filter on created_at for lookups and purges
+        return dict(
+            collection_name=self.collection_name,
+            field_name="created_at",
+            field_schema=models.PayloadSchemaType.FLOAT,
+        )
+
+    def ensure_collection(self):
+        global _collection_ready
+        if _collection_ready:
+            return
+        if not self.client.collection_exists(self.collection_name):
+            self.client.create_collection(**self._create_collection())
+            self.client.create_payload_index(**self._created_at_index())
+        _collection_ready = True
+
+    async def aensure_collection(self):
+        global _async_collection_ready
+        if _async_collection_ready or _collection_ready:
+            return
+        client = self.qdrant.async_client
+        if not await client.collection_exists(self.collection_name):
+            await client.create_collection(**self._create_collection())
+            await client.create_payload_index(**self._created_at_index())
+        _async_collection_ready = True
+
+    def _query(self, vector):
+        return dict(
+            collection_name=self.collection_name,
+            query=vector,
+            limit=3,
+            score_threshold=SEMANTIC_CACHE_THRESHOLD,
+            query_filter=models.Filter(must=[
+                models.FieldCondition(
+                    key="created_at",
+                    range=models.Range(gte=time.time() - SEMANTIC_CACHE_TTL),
+                )
+            ]),
+            with_payload=True,
+        )
+
+    def _match(self, hits, context_ids):
+        wanted = sorted(context_ids)
+        for hit in hits:
+            if hit.payload.get("context_ids") == wanted:
+                _count("hits")
+                return hit.payload["answer"]
+
+        _count("misses")
+        return None
+
+    def _point(self, vector, question, context_ids, answer):
+        return models.PointStruct(
+            id=str(uuid.uuid4()),
+            vector=vector,
+            payload={
+                "question": question,
+                "answer": answer,
+                "context_ids": sorted(context_ids),
+                "created_at": time.time(),
+            }
+        )
+
+    def _expired(self):
+        return models.FilterSelector(filter=models.Filter(must=[
+            models.FieldCondition(
+                key="created_at",
+                range=models.Range(lt=time.time() - SEMANTIC_CACHE_TTL),
+            )
+        ]))
+
+    def _purge_due(self):
+        """True for at most one caller per SEMANTIC_CACHE_PURGE_INTERVAL"""
+        global _last_purge
+        with _stats_lock:
+            now = time.monotonic()
+            if _last_purge and now - _last_purge < SEMANTIC_CACHE_PURGE_INTERVAL:
+                return False
+            _last_purge = now
+            return True
+
+    def lookup(self, vector, context_ids):
+        """Return a cached answer or None"""
+        if not SEMANTIC_CACHE_ENABLED:
+            return None
+        try:
+            self.ensure_collection()
+            hits = self.client.query_points(**self._query(vector)).points
+        except Exception as e:
+            print(f"DEBUG: Semantic cache lookup failed: {e}")
+            _count("errors")
+            return None
+        return self._match(hits, context_ids)
+
+    async def alookup(self, vector, context_ids):
+        """Async twin of lookup for the ASGI endpoints"""
+        if not SEMANTIC_CACHE_ENABLED:
+            return None
+        try:
+            await self.aensure_collection()
+            hits = (await self.qdrant.async_client.query_points(**self._query(vector))).points
+        except Exception as e:
+            print(f"DEBUG: Semantic cache lookup failed: {e}")
+            _count("errors")
+            return None
+        return self._match(hits, context_ids)
+
+    def store(self, vector, question, context_ids, answer):
+        if not SEMANTIC_CACHE_ENABLED or not answer:
+            return
+        try:
+            self.ensure_collection()
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=[self._point(vector, question, context_ids, answer)],
+                wait=False,
+            )
+            _count("stores")
+            if self._purge_due():
+                self.purge_expired()
+        except Exception as e:
+            print(f"DEBUG: Semantic cache store failed: {e}")
+            _count("errors")
+
+    async def astore(self, vector, question, context_ids, answer):
+        if not SEMANTIC_CACHE_ENABLED or not answer:
+            return
+        try:
+            await self.aensure_collection()
+            await self.qdrant.async_client.upsert(
+                collection_name=self.collection_name,
+                points=[self._point(vector, question, context_ids, answer)],
+                wait=False,
+            )
+            _count("stores")
+            if self._purge_due():
+                await self.apurge_expired()
+        except Exception as e:
+            print(f"DEBUG: Semantic cache store failed: {e}")
+            _count("errors")
+
+    def purge_expired(self):
+        """Delete answers older than SEMANTIC_CACHE_TTL (lookups already ignore them)"""
+        self.ensure_collection()
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=self._expired(),
+            wait=False,
+        )
+        _count("purges")
+
+    async def apurge_expired(self):
+        await self.aensure_collection()
+        await self.qdrant.async_client.delete(
+            collection_name=self.collection_name,
+            points_selector=self._expired(),
+            wait=False,
+        )
+        _count("purges")
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import re
+
+from django.db.models import Q
+
+from news.models import ArticleSignature
+
+# Hashes at most this many bits apart are treated as the same story (max 3, see bands())
+SIMHASH_MAX_DISTANCE = min(3, int(os.getenv("SIMHASH_MAX_DISTANCE", "3")))
+# Words per shingle
+SIMHASH_SHINGLE_SIZE = int(os.getenv("SIMHASH_SHINGLE_SIZE", "3"))
+# Shorter texts (e.g. bare headlines) don't carry enough signal to call them duplicates
+SIMHASH_MIN_WORDS = int(os.getenv("SIMHASH_MIN_WORDS", "8"))
+
+BANDS = 4
+BAND_BITS = 16
+_WORD_RE = re.compile(r"\w+")
+
+
+def simhash(text):
+    """64-bit SimHash over word shingles, or None if the text is too short"""
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) < SIMHASH_MIN_WORDS:
+        return None
+
+    n = SIMHASH_SHINGLE_SIZE
+    weights = [0] * 64
+    for i in range(max(1, len(words) - n + 1)):
+        shingle = " ".join(words[i:i + n]).encode("utf-8")
+        h = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def bands(h):
+    """
+    Four 16-bit slices. Two hashes differing in at most 3 bits must agree
+    on at least one slice (pigeonhole), so these are exact candidate keys.
+    """
+    return [h >> (BAND_BITS * i) & 0xFFFF for i in range(BANDS)]
+
+
+def _to_db(h):
+    # BigIntegerField is signed
+    return h - (1 << 64) if h >= 1 << 63 else h
+
+
+def _from_db(value):
+    return value + (1 << 64) if value < 0 else value
+
+
+def find_near_duplicate(kind, h, exclude_article_ids=(), queryset=None):
+    """
+    Article id of a stored signature within SIMHASH_MAX_DISTANCE of h, or None.
+    `queryset` narrows the candidates (e.g. only already-summarized articles).
+    """
+    qs = queryset if queryset is not None else ArticleSignature.objects.all()
+    band_match = Q()
+    for i, value in enumerate(bands(h)):
+        band_match |= Q(**{f"band_{i}": value})
+
+    candidates = (
+        qs.filter(kind=kind)
+        .filter(band_match)
+        .exclude(article_id__in=list(exclude_article_ids))
+        .values_list("article_id", "simhash")
+    )
+    for article_id, other in candidates:
+        if hamming(h, _from_db(other)) <= SIMHASH_MAX_DISTANCE:
+            return article_id
+    return None
+
+
+def save_signatures(kind, hashes):
+    """Store {article_id: simhash} for one kind, replacing older signatures"""
+    ArticleSignature.objects.bulk_create(
+        [
+            ArticleSignature(
+                article_id=article_id,
+                kind=kind,
+                simhash=_to_db(h),
+                **{f"band_{i}": value for i, value in enumerate(bands(h))},
+            )
+            for article_id, h in hashes.items()
+            if h is not None
+        ],
+        update_conflicts=True,
+        unique_fields=["article", "kind"],
+        update_fields=["simhash", "band_0", "band_1", "band_2", "band_3"],
+    )
+
+
+class RunSignatures:
+    """In-memory band index for duplicates within the current run, before anything is stored"""
+
+    def __init__(self):
+        self._bands = [{} for _ in range(BANDS)]
+
+    def find(self, h):
+        for i, value in enumerate(bands(h)):
+            for key, other in self._bands[i].get(value, ()):
+                if hamming(h, other) <= SIMHASH_MAX_DISTANCE:
+                    return key
+        return None
+
+    def add(self, key, h):
+        for i, value in enumerate(bands(h)):
+            self._bands[i].setdefault(value, []).append((key, h))
@@ -0,0 +1,82 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class DomainThrottle:
+    """
+    Politeness limiter shared by worker threads.
+    Caps concurrent requests per domain and keeps at least `min_interval`
+    seconds between request starts on the same domain, while requests to
+    different domains proceed in parallel.
+    """
+
+    def __init__(self, min_interval=0.0, max_concurrent=1):
+        self.min_interval = min_interval
+        self.max_concurrent = max(1, max_concurrent)
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._next_allowed = {}
+
+    @staticmethod
+    def domain_of(url):
+        return urlparse(url).netloc.lower()
+
+    @contextmanager
+    def slot(self, url):
+        domain = self.domain_of(url)
+
+        with self._lock:
+            sem = self._slots.get(domain)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_concurrent)
+                self._slots[domain] = sem
+
+        sem.acquire()
+        try:
+            # Reserve the next start time for this domain, then sleep outside the lock
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_allowed.get(domain, 0.0))
+                self._next_allowed[domain] = start + self.min_interval
+
+            delay = start - now
+            if delay > 0:
+                time.sleep(delay)
+            yield
+        finally:
+            sem.release()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by workers hitting one upstream API.
+    `rate` tokens are added per second up to `capacity`; acquire() blocks
+    until a token is available. A rate of None means unlimited.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
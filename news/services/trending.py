@@ -0,0 +1,39 @@
+import os
+
+from django.utils import timezone
+
+from news.models import TrendingSnapshot
+from news.services.adzuna import TRENDING_CATEGORIES, compute_trending_stats
+
+# Countries precomputed by default (Adzuna country codes)
+TRENDING_COUNTRIES = [
+    c.strip().lower() for c in os.getenv("TRENDING_COUNTRIES", "in").split(",") if c.strip()
+]
+
+
+def precompute_trending_snapshots(countries=None, categories=None):
+    """
+    Scheduler entry point (cron, celery beat, ...): fetch trending stats from
+    Adzuna and store one snapshot per country. Returns the saved snapshots.
+    """
+    saved = []
+    for country in countries or TRENDING_COUNTRIES:
+        stats = compute_trending_stats(country, categories or TRENDING_CATEGORIES)
+        # All zeros means Adzuna failed or keys are missing, keep the previous snapshot
+        if not any(s["count"] for s in stats):
+            print(f"Skipping empty trending stats for {country}")
+            continue
+        saved.append(TrendingSnapshot.objects.create(
+            country=country,
+            stats=stats,
+            computed_at=timezone.now(),
+        ))
+    return saved
+
+
+def latest_trending_snapshot(country):
+    return (
+        TrendingSnapshot.objects.filter(country=country)
+        .order_by("-computed_at")
+        .first()
+    )
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from news.feed_cache import invalidate_feed
+from news.models import Article, SummaryPage
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=SummaryPage)
+@receiver(post_delete, sender=SummaryPage)
+def invalidate_feed_on_change(sender, **kwargs):
+    invalidate_feed()
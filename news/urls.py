@@ -1,14 +1,25 @@
 from django.urls import path
 from news.views import (
     SummaryListAPIView,
+    SummaryFeedAPIView,
+    SummaryDetailAPIView,
     ArticleChatAPIView,
+    ArticleChatStreamAPIView,
     RegisterAPIView,
     JobSearchAPIView,
     TrendingJobsAPIView,
     CareerComparisonAPIView,
     GeneralChatAPIView,
+    GeneralChatStreamAPIView,
     QdrantStatusAPIView,
 )
+from news.async_views import (
+    AsyncArticleChatView,
+    AsyncArticleChatStreamView,
+    AsyncGeneralChatView,
+    AsyncGeneralChatStreamView,
+    AsyncCareerComparisonView,
+)
 
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
@@ -21,10 +32,21 @@ urlpatterns = [
     path("api/register/", RegisterAPIView.as_view()),
 
     path("api/summaries/", SummaryListAPIView.as_view(), name="summary-list"),
+    path("api/summaries/feed/", SummaryFeedAPIView.as_view(), name="summary-feed"),
+    path("api/summaries/<int:pk>/", SummaryDetailAPIView.as_view(), name="summary-detail"),
     path("api/chat/", ArticleChatAPIView.as_view()),
+    path("api/chat/stream/", ArticleChatStreamAPIView.as_view(), name="chat_stream"),
     path("api/jobs/", JobSearchAPIView.as_view()),
     path("api/jobs/trending/", TrendingJobsAPIView.as_view()),
     path("api/compare/", CareerComparisonAPIView.as_view()),
     path("api/general-chat/", GeneralChatAPIView.as_view(), name="general_chat"),
+    path("api/general-chat/stream/", GeneralChatStreamAPIView.as_view(), name="general_chat_stream"),
     path("api/qdrant-status/", QdrantStatusAPIView.as_view(), name="qdrant_status"),
+
+    # Async (ASGI) variants of the AI endpoints, same request/response shapes
+    path("api/async/chat/", AsyncArticleChatView.as_view(), name="async_chat"),
+    path("api/async/chat/stream/", AsyncArticleChatStreamView.as_view(), name="async_chat_stream"),
+    path("api/async/general-chat/", AsyncGeneralChatView.as_view(), name="async_general_chat"),
+    path("api/async/general-chat/stream/", AsyncGeneralChatStreamView.as_view(), name="async_general_chat_stream"),
+    path("api/async/compare/", AsyncCareerComparisonView.as_view(), name="async_compare"),
 ]
@@ -1,4 +1,8 @@
+import json
+from itertools import chain
+
 from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -9,8 +13,15 @@ from news.models import (
     SummaryPage,
     Topic,
 )
-from news.serializers import SummaryPageSerializer
-from news.services.gemini import article_conversation, general_conversation, compare_careers
+from news.feed_cache import cached_feed_response
+from news.pagination import PublishedAtCursorPagination
+from news.serializers import SummaryPageSerializer, SummaryCardSerializer
+from news.services.gemini import (
+    article_conversation,
+    general_conversation,
+    stream_article_conversation,
+    stream_general_conversation,
+)
 from news.services.adzuna import search_adzuna_jobs
 
 
@@ -54,9 +65,53 @@ class SummaryListAPIView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        # Return ALL summaries, latest first
-        summaries = SummaryPage.objects.select_related("article").order_by("-article__published_at")
-        serializer = SummaryPageSerializer(summaries, many=True)
+        def build():
+            # Return ALL summaries, latest first
+            summaries = SummaryPage.objects.select_related("article").order_by("-article__published_at")
+            return SummaryPageSerializer(summaries, many=True).data
+
+        return cached_feed_response(request, build)
+
+
+def feed_queryset():
+    """Columns needed for feed cards only"""
+    return (
+        SummaryPage.objects.select_related("article")
+        .only(
+            "id", "hero_image", "short_preview", "summarized_at", "model_version",
+            "article__id", "article__source", "article__title",
+            "article__url", "article__published_at",
+        )
+    )
+
+
+# Paginated home feed: ?cursor=<next_cursor>&page_size=20
+class SummaryFeedAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        def build():
+            paginator = PublishedAtCursorPagination()
+            page = paginator.paginate_queryset(feed_queryset(), request, view=self)
+            serializer = SummaryCardSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data).data
+
+        return cached_feed_response(request, build)
+
+
+# Full summary (ai_summary + article snippet) for one feed card
+class SummaryDetailAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, pk):
+        try:
+            summary = SummaryPage.objects.select_related("article").get(pk=pk)
+        except SummaryPage.DoesNotExist:
+            return Response(
+                {"error": "Summary not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        serializer = SummaryPageSerializer(summary)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -101,6 +156,78 @@ class ArticleChatAPIView(APIView):
             )
 
 
+def sse_event(data, event=None):
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+def sse_response(chunks, done=None):
+    """
+    Server-sent events: one `data: {"delta": ...}` per chunk, then `event: done`.
+    The first chunk is pulled before the response starts, so model fallback and
+    auth errors still become a normal JSON 500 instead of a broken stream.
+
+    WSGI only: under ASGI Django buffers a sync iterator completely before
+    sending it, so nothing reaches the client until generation is done.
+    The /api/async/.../stream/ endpoints (async_views.asse_response) are
+    the ASGI equivalents.
+    """
+    first = next(chunks, None)
+
+    def events():
+        try:
+            for text in chain([first] if first else [], chunks):
+                yield sse_event({"delta": text})
+        except Exception as e:
+            yield sse_event({"error": f"AI service failed: {str(e)}"}, event="error")
+            return
+        yield sse_event(done or {}, event="done")
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+# Ask about article, streamed
+class ArticleChatStreamAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        summary_id = request.data.get("summary_id")
+        user_question = request.data.get("question")
+
+        if not summary_id or not user_question:
+            return Response(
+                {"error": "summary_id and question are required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            summary = SummaryPage.objects.select_related("article").get(
+                id=summary_id
+            )
+        except SummaryPage.DoesNotExist:
+            return Response(
+                {"error": "Summary not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            article_text = summary.article.snippet or summary.article.title
+            chunks = stream_article_conversation(
+                article_text=article_text,
+                user_question=user_question
+            )
+            return sse_response(chunks)
+        except Exception as e:
+            return Response(
+                {"error": f"AI service failed: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 # Job Search Proxy
 class JobSearchAPIView(APIView):
     permission_classes = [AllowAny]
@@ -115,18 +242,34 @@ class JobSearchAPIView(APIView):
         return Response(data, status=status.HTTP_200_OK)
 
 
-from news.services.adzuna import get_trending_stats
+from news.services.adzuna import ADZUNA_COUNTRIES, get_trending_stats
+from news.services.trending import latest_trending_snapshot
 
 class TrendingJobsAPIView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        country = request.query_params.get("country", "in")
-        stats = get_trending_stats(country=country)
-        return Response(stats, status=status.HTTP_200_OK)
+        country = request.query_params.get("country", "in").strip().lower()
 
-from news.services.gemini import compare_careers
-import json
+        # Any Adzuna country may have snapshots (precompute_trending --countries)
+        if country not in ADZUNA_COUNTRIES:
+            return Response(
+                {"error": f"Trending stats are not available for '{country}'"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        # Served from the latest precomputed snapshot (precompute_trending)
+        snapshot = latest_trending_snapshot(country)
+        if snapshot is None:
+            # Not precomputed: the in-process cache fetches from Adzuna once per
+            # TTL and country, however many requests arrive meanwhile
+            return Response(get_trending_stats(country), status=status.HTTP_200_OK)
+
+        response = Response(snapshot.stats, status=status.HTTP_200_OK)
+        response["X-Computed-At"] = snapshot.computed_at.isoformat()
+        return response
+
+from news.services.comparisons import get_career_comparison
 
 class CareerComparisonAPIView(APIView):
     permission_classes = [AllowAny]
@@ -142,15 +285,7 @@ class CareerComparisonAPIView(APIView):
             )
 
         try:
-            comparison_text = compare_careers(career1, career2)
-            # Remove markdown code blocks if Gemini includes them
-            clean_json = comparison_text.strip()
-            if clean_json.startswith("```json"):
-                clean_json = clean_json[7:-3].strip()
-            elif clean_json.startswith("```"):
-                clean_json = clean_json[3:-3].strip()
-            
-            data = json.loads(clean_json)
+            data = get_career_comparison(career1, career2)
             return Response(data, status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
@@ -182,11 +317,42 @@ class QdrantStatusAPIView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        from news.services.qdrant_service import QdrantService
+        from news.services.qdrant_service import get_qdrant_service
+        from news.services.semantic_cache import semantic_cache_stats
         try:
-            qdrant = QdrantService()
+            qdrant = get_qdrant_service()
             # Try a simple light-weight operation
             qdrant.client.get_collections()
-            return Response({"status": "connected"}, status=status.HTTP_200_OK)
+            cache = qdrant.embedding_cache
+            return Response(
+                {
+                    "status": "connected",
+                    "embedding_cache": cache.stats() if cache else None,
+                    "semantic_cache": semantic_cache_stats(),
+                },
+                status=status.HTTP_200_OK
+            )
         except Exception:
             return Response({"status": "unavailable"}, status=status.HTTP_200_OK)
+
+
+class GeneralChatStreamAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        user_question = request.data.get("question")
+
+        if not user_question:
+            return Response(
+                {"error": "Question is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            chunks, used_context = stream_general_conversation(user_question=user_question)
+            return sse_response(chunks, done={"used_context": used_context})
+        except Exception as e:
+            return Response(
+                {"error": f"AI service failed: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )